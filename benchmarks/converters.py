@@ -0,0 +1,74 @@
+"""
+Measure the throughput of `convert_and_validate` per type family.
+
+Prints a JSON object with the number of conversions per second for each family,
+using the compiled converter cache like settings loading does. Conversions are
+measured with the conversion result cache disabled, as converting one value
+repeatedly would otherwise only measure cache hits, and separately with it.
+"""
+
+import json
+import timeit
+from typing import Any
+
+from pyttings.type_converter import (
+    CONVERSION_CACHE_SIZE,
+    configure_conversion_cache,
+    convert_and_validate,
+)
+
+LARGE_LIST_SIZE = 10_000
+
+
+class Point:
+    def __init__(self, x: int, y: int):
+        self.x, self.y = x, y
+
+    @classmethod
+    def __pyttings_convert__(cls, value: list[int]) -> "Point":
+        return cls(*value)
+
+
+# Type hint and configured value of each family
+FAMILIES: dict[str, tuple[Any, str]] = {
+    "bool": (bool, "true"),
+    "int": (int, "8000"),
+    "union": (int | list[int], "[1, 2, 3]"),
+    "optional": (int | None, "8000"),
+    "generic_container": (dict[str, list[int]], '{"a": [1, 2], "b": [3]}'),
+    "fixed_tuple": (tuple[int, str, float], "(1, 'a', 2.0)"),
+    "custom_class": (Point, "[1, 2]"),
+    "large_list": (list[int], str(list(range(LARGE_LIST_SIZE)))),
+}
+
+
+def conversions_per_second(expected_type: Any, value: str) -> float:
+    """Convert the same value repeatedly and return the conversion rate."""
+    timer = timeit.Timer(
+        lambda: convert_and_validate("BENCHMARK", value, expected_type)
+    )
+    number, elapsed = timer.autorange()
+    return number / min(elapsed, *timer.repeat(repeat=4, number=number))
+
+
+def measure_families() -> dict[str, float]:
+    """Measure the conversion rate of every family."""
+    return {
+        family: conversions_per_second(expected_type, value)
+        for family, (expected_type, value) in FAMILIES.items()
+    }
+
+
+def run() -> dict:
+    """Measure the conversion rate of every family, without and with result cache."""
+    configure_conversion_cache(0)
+    uncached = measure_families()
+    configure_conversion_cache(CONVERSION_CACHE_SIZE or 256)
+    return {
+        "conversions_per_second": uncached,
+        "cached_conversions_per_second": measure_families(),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
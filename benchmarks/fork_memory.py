@@ -0,0 +1,122 @@
+"""
+Measure the memory each forked worker stops sharing with the master process.
+
+A generated settings module with many collection settings is loaded in a master
+process, which forks workers that read settings and run a garbage collection.
+Workers either read every setting (`all`) or only a few hot ones (`hot`). Prints
+a JSON object with the median unique set size (USS, private pages read from
+/proc/self/smaps_rollup) of the workers in KiB, with and without
+`Settings.prepare_for_fork()`. Linux only.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+WORKERS = 8
+SETTINGS = 2000
+HOT_SETTINGS = 20
+ELEMENTS = 50
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def unique_set_size() -> int:
+    """Get the private memory of the current process in KiB."""
+    size = 0
+    with open("/proc/self/smaps_rollup") as smaps:
+        for line in smaps:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                size += int(line.split()[1])
+    return size
+
+
+def run_master(prepare: bool, pattern: str) -> None:
+    """Load the settings, fork the workers and print their median unique set size."""
+    import gc
+
+    from pyttings.core import Settings
+
+    settings = Settings()
+    if prepare:
+        settings.prepare_for_fork()
+    names = [f"SETTING_{index}" for index in range(SETTINGS)]
+    if pattern == "hot":
+        names = names[:: SETTINGS // HOT_SETTINGS]
+
+    sizes = []
+    for _ in range(WORKERS):
+        read_fd, write_fd = os.pipe()
+        if os.fork() == 0:
+            os.close(read_fd)
+            for name in names:
+                for _ in getattr(settings, name):
+                    pass
+            gc.collect()
+            os.write(write_fd, str(unique_set_size()).encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            sizes.append(int(pipe.read()))
+        os.wait()
+    print(statistics.median(sizes))
+
+
+def write_settings_module(directory: str) -> None:
+    """Generate a settings module with list, set and dict settings."""
+    lines = []
+    for index in range(SETTINGS):
+        kind = ("list", "set", "dict")[index % 3]
+        if kind == "dict":
+            value = repr({f"key_{i}": [i] for i in range(ELEMENTS)})
+        else:
+            elements = ", ".join(repr(f"value_{index}_{i}") for i in range(ELEMENTS))
+            value = f"[{elements}]" if kind == "list" else f"{{{elements}}}"
+        lines.append(f"SETTING_{index}: {kind} = {value}")
+    with open(os.path.join(directory, "fork_settings.py"), "w") as settings_file:
+        settings_file.write("\n".join(lines) + "\n")
+
+
+def measure(prepare: bool, pattern: str, directory: str) -> int:
+    """Run a master process in a fresh interpreter and return the median USS."""
+    result = subprocess.run(
+        [sys.executable, __file__, "prepared" if prepare else "baseline", pattern],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+        env=os.environ
+        | {
+            "PYTHONPATH": os.pathsep.join([ROOT, directory]),
+            "PYTTING_SETTINGS_MODULE": "fork_settings",
+        },
+    )
+    return int(float(result.stdout))
+
+
+def run() -> dict:
+    """Measure the worker memory with and without `prepare_for_fork()`."""
+    with tempfile.TemporaryDirectory() as directory:
+        write_settings_module(directory)
+        return {
+            "workers": WORKERS,
+            "settings": SETTINGS,
+            "worker_uss_kib": {
+                pattern: measure(False, pattern, directory)
+                for pattern in ("all", "hot")
+            },
+            "prepared_worker_uss_kib": {
+                pattern: measure(True, pattern, directory) for pattern in ("all", "hot")
+            },
+        }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run_master(prepare=sys.argv[1] == "prepared", pattern=sys.argv[2])
+    elif not os.path.exists("/proc/self/smaps_rollup"):
+        sys.exit("This benchmark requires /proc/self/smaps_rollup (Linux).")
+    else:
+        print(json.dumps(run(), indent=2))
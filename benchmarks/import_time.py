@@ -0,0 +1,60 @@
+"""
+Measure the cost of `import pyttings` with `python -X importtime`.
+
+Prints a JSON object with the cumulative import time of the `pyttings` package
+in microseconds (median of several runs) and the modules it imports.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 10
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time() -> int:
+    """Run one fresh interpreter and return the cumulative `pyttings` import time."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pyttings"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "pyttings":
+            return int(cumulative)
+    raise RuntimeError("pyttings was not imported")
+
+
+def imported_modules() -> list[str]:
+    """List the modules `import pyttings` adds to a fresh interpreter."""
+    code = (
+        "import sys; before = set(sys.modules); import pyttings; "
+        "print('\\n'.join(sorted(set(sys.modules) - before)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    return result.stdout.split()
+
+
+def run() -> dict:
+    """Measure the import time and list the imported modules."""
+    times = [import_time() for _ in range(RUNS)]
+    return {
+        "import_time_us": statistics.median(times),
+        "imported_modules": imported_modules(),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,127 @@
+"""
+Measure how long loading settings takes.
+
+Settings modules with 10, 100 and 1000 settings of mixed types are generated and
+half of their settings are overridden, in an environment padded to 5000
+variables. Prints a JSON object with, per settings count, the median time in
+microseconds of an eager `Settings()` (including the settings module import, but
+not the import of pyttings itself, see `import_time.py`) and of the first lazy
+access to a setting, and the median warm access time in nanoseconds.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+
+COUNTS = (10, 100, 1000)
+ENVIRON_SIZE = 5000
+RUNS = 5
+LAZY_ACCESSES = 10
+WARM_ACCESSES = 100_000
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Type hint, default and override of the generated settings, in turns
+SETTING_TYPES = (
+    ("bool", "True", "false"),
+    ("int", "8000", "8080"),
+    ("str", "'value'", "other"),
+    ("list[int]", "[1, 2, 3]", "[4, 5, 6, 7]"),
+    ("dict[str, int]", "{'a': 1}", '{"b": 2, "c": 3}'),
+    ("int | None", "None", "42"),
+)
+
+
+def run_child(count: int) -> None:
+    """Load the generated settings and print the timings."""
+    from pyttings.core import Settings
+
+    start = timeit.default_timer()
+    Settings()
+    eager = timeit.default_timer() - start
+
+    from pyttings.type_converter import clear_converter_cache
+
+    clear_converter_cache()
+    settings = Settings(lazy_load=True)
+    names = [f"SETTING_{index}" for index in range(min(count, LAZY_ACCESSES))]
+    start = timeit.default_timer()
+    for name in names:
+        getattr(settings, name)
+    lazy = (timeit.default_timer() - start) / len(names)
+
+    warm = timeit.timeit(
+        "settings.SETTING_0", globals={"settings": settings}, number=WARM_ACCESSES
+    )
+    print(
+        json.dumps(
+            {
+                "eager_us": eager * 1e6,
+                "lazy_first_access_us": lazy * 1e6,
+                "warm_access_ns": warm / WARM_ACCESSES * 1e9,
+            }
+        )
+    )
+
+
+def write_settings_module(directory: str, count: int) -> dict[str, str]:
+    """Generate a settings module and return the environment overriding it."""
+    lines, environ = [], {}
+    for index in range(count):
+        hint, default, override = SETTING_TYPES[index % len(SETTING_TYPES)]
+        lines.append(f"SETTING_{index}: {hint} = {default}")
+        if index % 2 == 0:
+            environ[f"PYTTING_SETTING_{index}"] = override
+    with open(os.path.join(directory, f"load_settings_{count}.py"), "w") as file:
+        file.write("\n".join(lines) + "\n")
+    return environ
+
+
+def measure(count: int, directory: str) -> dict[str, float]:
+    """Load the settings in fresh interpreters and return the median timings."""
+    environ = {
+        name: value
+        for name, value in os.environ.items()
+        if not name.startswith("PYTTING_")
+    }
+    environ |= write_settings_module(directory, count) | {
+        "PYTHONPATH": os.pathsep.join([ROOT, directory]),
+        "PYTTING_SETTINGS_MODULE": f"load_settings_{count}",
+    }
+    environ |= {
+        f"BENCHMARK_PADDING_{index}": "x"
+        for index in range(max(ENVIRON_SIZE - len(environ), 0))
+    }
+
+    runs = [
+        json.loads(
+            subprocess.run(
+                [sys.executable, __file__, str(count)],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=ROOT,
+                env=environ,
+            ).stdout
+        )
+        for _ in range(RUNS)
+    ]
+    return {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+
+def run() -> dict:
+    """Measure the load timings for every settings count."""
+    with tempfile.TemporaryDirectory() as directory:
+        return {
+            "environ_size": ENVIRON_SIZE,
+            "settings": {str(count): measure(count, directory) for count in COUNTS},
+        }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run_child(int(sys.argv[1]))
+    else:
+        print(json.dumps(run(), indent=2))
@@ -0,0 +1,89 @@
+"""
+Run every benchmark and print the results as a single JSON document.
+
+Each benchmark runs in a fresh interpreter. The results are tagged with the
+Python, platform, pyttings version and git commit, so runs of different versions
+can be compared. Use `--output` to also write them to a file.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from contextlib import suppress
+from typing import Any
+
+BENCHMARKS = ("import_time", "load_time", "converters", "fork_memory")
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCHMARKS_DIR)
+
+
+def pyttings_version() -> str | None:
+    """Get the installed pyttings version, if it is installed."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    with suppress(PackageNotFoundError):
+        return version("pyttings")
+    return None
+
+
+def git_commit() -> str | None:
+    """Get the checked out git commit, if any."""
+    with suppress(OSError, subprocess.CalledProcessError):
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT,
+        ).stdout.strip()
+    return None
+
+
+def run_benchmark(name: str) -> Any:
+    """Run a benchmark script and return its results, or the error it failed with."""
+    pythonpath = os.pathsep.join(filter(None, [ROOT, os.getenv("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, os.path.join(BENCHMARKS_DIR, f"{name}.py")],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=os.environ | {"PYTHONPATH": pythonpath},
+    )
+    if result.returncode != 0:
+        return {"error": (result.stderr.strip().splitlines() or ["unknown"])[-1]}
+    return json.loads(result.stdout)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="also write the results to this file")
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        help=f"benchmarks to run among {', '.join(BENCHMARKS)}, all by default",
+    )
+    args = parser.parse_args()
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark '{name}'")
+
+    results = json.dumps(
+        {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "pyttings": pyttings_version(),
+            "commit": git_commit(),
+            "benchmarks": {
+                name: run_benchmark(name) for name in args.benchmarks or BENCHMARKS
+            },
+        },
+        indent=2,
+    )
+    print(results)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(results + "\n")
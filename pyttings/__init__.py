@@ -1,9 +1,45 @@
+import _thread
 import os
 
-from pyttings.type_converter import parse_bool
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .core import Settings
 
-from .core import Settings
-
-settings = Settings(lazy_load=parse_bool(os.getenv("PYTTING_LAZY_LOAD", "False")))
+    settings: Settings
 
 __all__ = ["settings"]
+
+# `_thread` is always loaded already, unlike `threading`
+_settings_lock = _thread.RLock()
+
+
+def __getattr__(name: str) -> "Settings":
+    # Build the settings on first access (PEP 562), keeping `import pyttings` cheap
+    if name == "settings":
+        with _settings_lock:
+            # Another thread may have built them while this one waited
+            if "settings" in globals():
+                return globals()["settings"]
+            return _build_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _build_settings() -> "Settings":
+    from pyttings.type_converter import parse_bool
+
+    from .core import Settings
+
+    settings_class: type[Settings] = Settings
+    if parse_bool(os.getenv("PYTTINGS_INSTRUMENT", "False")):
+        from .instrumentation import InstrumentedSettings
+
+        settings_class = InstrumentedSettings
+
+    global settings
+    settings = settings_class(
+        lazy_load=parse_bool(os.getenv("PYTTING_LAZY_LOAD", "False")),
+        static_defaults=parse_bool(os.getenv("PYTTINGS_STATIC_DEFAULTS", "False")),
+        cache_dir=os.getenv("PYTTINGS_CACHE_DIR"),
+        load_workers=int(os.getenv("PYTTINGS_LOAD_WORKERS", "0")),
+    )
+    return settings
@@ -0,0 +1,226 @@
+import hashlib
+import io
+import os
+import pickle
+import stat
+import sys
+import tempfile
+from array import array
+from contextlib import suppress
+from decimal import Decimal
+from typing import Any, Iterable
+
+CACHE_FORMAT = 1
+EXPORT_ENV_VAR = "PYTTINGS_EXPORTED_SETTINGS"
+# Linux refuses to start processes with a single environment string over 128 KiB
+EXPORT_MAX_SIZE = 64 * 1024
+# Configuration that changes how settings are loaded, but not their values
+FINGERPRINT_IGNORED_ENV_VARS = {
+    EXPORT_ENV_VAR,
+    "PYTTING_LAZY_LOAD",
+    "PYTTINGS_STATIC_DEFAULTS",
+    "PYTTINGS_CACHE_DIR",
+    "PYTTINGS_LOAD_WORKERS",
+    "PYTTINGS_INSTRUMENT",
+    "PYTTINGS_CONVERSION_CACHE_SIZE",
+}
+SERIALIZABLE_SCALAR_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    Decimal,
+    array,
+)
+SERIALIZABLE_CONTAINER_TYPES = (list, tuple, set, frozenset)
+ALLOWED_GLOBALS = {
+    ("builtins", "set"),
+    ("builtins", "frozenset"),
+    ("builtins", "complex"),
+    ("decimal", "Decimal"),
+    ("array", "array"),
+    ("array", "_array_reconstructor"),
+}
+
+
+class _SettingsUnpickler(pickle.Unpickler):
+    """Unpickler refusing anything but the types settings are cached as."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in ALLOWED_GLOBALS:
+            raise pickle.UnpicklingError(f"Refusing to load '{module}.{name}'")
+        return super().find_class(module, name)
+
+
+def is_serializable(value: Any) -> bool:
+    """Check if a value only holds types that can be safely cached."""
+    if type(value) in SERIALIZABLE_SCALAR_TYPES:
+        return True
+    if type(value) in SERIALIZABLE_CONTAINER_TYPES:
+        return all(map(is_serializable, value))
+    if type(value) is dict:
+        return all(map(is_serializable, value)) and all(
+            map(is_serializable, value.values())
+        )
+    return False
+
+
+def _module_path(module_name: str) -> str | None:
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return getattr(module, "__file__", None)
+
+    import importlib.util
+
+    with suppress(ImportError, ValueError):
+        spec = importlib.util.find_spec(module_name)
+        return spec.origin if spec is not None else None
+    return None
+
+
+def settings_fingerprint(
+    settings_module: str, env_prefix: str, *extra: Any
+) -> str | None:
+    """
+    Fingerprint everything resolved settings depend on.
+
+    That is the settings module file, the pyttings sources, the Python version and
+    the environment variables starting with `env_prefix`, `PYTTING_` or `PYTTINGS_`. Returns
+    None if the settings module file can't be found.
+    """
+    module_path = _module_path(settings_module)
+    if module_path is None:
+        return None
+
+    package_dir = os.path.dirname(__file__)
+    paths = [module_path] + sorted(
+        os.path.join(package_dir, name)
+        for name in os.listdir(package_dir)
+        if name.endswith(".py")
+    )
+    digest = hashlib.sha256()
+    with suppress(OSError):
+        for path in paths:
+            stat = os.stat(path)
+            digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\0".encode())
+        environ = sorted(
+            (name, value)
+            for name, value in os.environ.items()
+            if name.startswith((env_prefix, "PYTTING_", "PYTTINGS_"))
+            and name not in FINGERPRINT_IGNORED_ENV_VARS
+        )
+        digest.update(
+            repr((CACHE_FORMAT, sys.version_info[:2], extra, environ)).encode()
+        )
+        return digest.hexdigest()
+    return None
+
+
+def dumps_settings(
+    fingerprint: str, values: dict[str, Any], volatile: Iterable[str] = ()
+) -> bytes:
+    """
+    Serialize the safely cacheable settings, recording the other keys.
+
+    `volatile` settings are recorded without their value, for settings that may
+    change while the fingerprint stays the same.
+    """
+    volatile = set(volatile)
+    cached = {
+        key: value
+        for key, value in values.items()
+        if key not in volatile and is_serializable(value)
+    }
+    excluded = [key for key in values if key not in cached]
+    return pickle.dumps(
+        (fingerprint, cached, excluded), protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+def loads_settings(
+    data: bytes, fingerprint: str
+) -> tuple[dict[str, Any], list[str]] | None:
+    """Deserialize cached settings, or None if stale or invalid."""
+    with suppress(Exception):
+        cached_fingerprint, values, excluded = _SettingsUnpickler(
+            io.BytesIO(data)
+        ).load()
+        if cached_fingerprint == fingerprint:
+            return values, excluded
+    return None
+
+
+def encode_settings(
+    fingerprint: str, values: dict[str, Any], volatile: Iterable[str] = ()
+) -> str:
+    """Serialize settings into a compact string that fits an environment variable."""
+    import base64
+    import zlib
+
+    data = dumps_settings(fingerprint, values, volatile)
+    return base64.b85encode(zlib.compress(data)).decode()
+
+
+def decode_settings(
+    data: str, fingerprint: str
+) -> tuple[dict[str, Any], list[str]] | None:
+    """Deserialize settings encoded by `encode_settings`, or None if stale or invalid."""
+    import base64
+    import zlib
+
+    with suppress(Exception):
+        return loads_settings(zlib.decompress(base64.b85decode(data)), fingerprint)
+    return None
+
+
+def is_private(status: os.stat_result) -> bool:
+    """
+    Check if a file is owned by the current user and only writable by them.
+
+    Other users could otherwise plant cached settings. Always true where files
+    have no owner, like on Windows.
+    """
+    getuid = getattr(os, "getuid", None)
+    if getuid is None:
+        return True
+    return status.st_uid == getuid() and not status.st_mode & (
+        stat.S_IWGRP | stat.S_IWOTH
+    )
+
+
+def read_cache(path: str, fingerprint: str) -> tuple[dict[str, Any], list[str]] | None:
+    """
+    Read cached settings from a file, or None if missing, stale or not private.
+
+    Both the file and its directory must be private, see `is_private`.
+    """
+    with suppress(OSError):
+        if not is_private(os.stat(os.path.dirname(path))):
+            return None
+        with open(path, "rb") as cache_file:
+            if not is_private(os.fstat(cache_file.fileno())):
+                return None
+            return loads_settings(cache_file.read(), fingerprint)
+    return None
+
+
+def write_cache(
+    path: str, fingerprint: str, values: dict[str, Any], volatile: Iterable[str] = ()
+) -> None:
+    """
+    Atomically write settings to a cache file, ignoring any failure.
+
+    The directory is created private to the current user, and nothing is written
+    to an existing directory that isn't, see `is_private`.
+    """
+    with suppress(OSError):
+        directory = os.path.dirname(path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not is_private(os.stat(directory)):
+            return
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as cache_file:
+            cache_file.write(dumps_settings(fingerprint, values, volatile))
+        os.replace(cache_file.name, path)
@@ -1,25 +1,148 @@
 import importlib
 import os
+import sys
+import threading
+import types
+from array import array, typecodes
 from contextlib import suppress
 from functools import cached_property
-from typing import Any, get_type_hints
+from typing import TYPE_CHECKING, Any, Callable, get_type_hints
 
-from pyttings.type_converter import convert_and_validate
+from pyttings.type_converter import (
+    ARRAY_TYPES,
+    aconvert,
+    get_cached_converter,
+    is_async_only_custom_class,
+    is_custom_class,
+    make_immutable,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from pyttings.static import StaticSettings
+
+_MISSING = object()
+
+# Called with the setting name, its old value and its new value (None when unset)
+SettingCallback = Callable[[str, Any, Any], Any]
+
+
+class _locked_cached_property(cached_property):
+    """A `cached_property` computed at most once per instance, even across threads."""
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        with suppress(KeyError):
+            return instance.__dict__[self.attrname]
+        with instance._build_lock:
+            return super().__get__(instance, owner)
+
+
+class FrozenSettings:
+    """Read-only snapshot of resolved settings, created by `Settings.freeze`."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"'{self.__class__.__name__}' object is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"'{self.__class__.__name__}' object is read-only")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {', '.join(self.__slots__)}>"
 
 
 class Settings:
-    CONFIGURATION_KEYS = (
-        "PYTTING_LAZY_LOAD",
-        "PYTTING_ENV_PREFIX",
-        "PYTTING_SETTINGS_MODULE",
-        "PYTTING_CUSTOM_CLASS_METHOD_NAME",
+    # Environment variables configuring pyttings itself rather than settings. Newer
+    # options use the `PYTTINGS_` namespace, which the default prefix doesn't cover
+    CONFIGURATION_KEYS = frozenset(
+        {
+            "PYTTING_LAZY_LOAD",
+            "PYTTING_ENV_PREFIX",
+            "PYTTING_SETTINGS_MODULE",
+            "PYTTING_CUSTOM_CLASS_METHOD_NAME",
+            "PYTTINGS_CUSTOM_CLASS_ASYNC_METHOD_NAME",
+            "PYTTINGS_CONTAINER_PARSER",
+            "PYTTINGS_VALIDATION",
+            "PYTTINGS_STATIC_DEFAULTS",
+            "PYTTINGS_CACHE_DIR",
+            "PYTTINGS_EXPORTED_SETTINGS",
+            "PYTTINGS_LOAD_WORKERS",
+            "PYTTINGS_INSTRUMENT",
+            "PYTTINGS_CONVERSION_CACHE_SIZE",
+        }
     )
 
-    def __init__(self, lazy_load: bool = False) -> None:
-        """Initialize the settings manager."""
+    def __init__(
+        self,
+        lazy_load: bool = False,
+        validation: str | None = None,
+        static_defaults: bool = False,
+        cache_dir: str | None = None,
+        load_workers: int = 0,
+    ) -> None:
+        """
+        Initialize the settings manager.
+
+        `validation` is the default policy for collection element validation
+        (`full`, `sampled:N` or `off`), falling back to `PYTTINGS_VALIDATION`.
+        Individual settings can override it through a `__pyttings_validation__`
+        mapping in the settings module.
+
+        With `static_defaults`, literal defaults and simple type hints are read from
+        the settings module's source, only importing it for anything else.
+
+        Each setting is loaded at most once, even when many threads access it at
+        the same time.
+
+        With `cache_dir`, eagerly loaded settings are persisted there and reused by
+        later processes for as long as the settings module, the pyttings sources
+        and the relevant environment variables are unchanged.
+
+        Settings exported by a parent process with `export_for_children` are
+        used as is when they still match, without importing the settings module.
+
+        With more than one `load_workers`, settings overridden with custom classes
+        are converted on a thread pool of that size when loading all settings.
+
+        Settings can be refreshed from the environment later with `reload`.
+        """
+        # Created first, as everything else may be built concurrently
+        self._lock = threading.Lock()
+        self._build_lock = threading.RLock()
+        self._key_locks: dict[str, threading.RLock] = {}
+        self._reload_lock = threading.RLock()
+        self._subscriptions: tuple[
+            tuple[Callable[[str], Any], SettingCallback, "Executor | None"], ...
+        ] = ()
         self._settings_module: str = self._load_settings_module()
         self._env_prefix: str = os.getenv("PYTTING_ENV_PREFIX", "PYTTING_")
-        self._cache: dict[str, Any] = {} if lazy_load else self.load_settings()
+        self._validation: str | None = validation
+        self._cache_dir: str | None = cache_dir
+        self._load_workers: int = load_workers
+        self._lazy_load: bool = lazy_load
+        self._module_mtime: int | None = None
+        # Settings read without importing the module track its file from the start
+        if static_defaults or cache_dir or "PYTTINGS_EXPORTED_SETTINGS" in os.environ:
+            self._module_mtime = self._get_source_mtime()
+        self._static: StaticSettings | None = None
+        if static_defaults and self._settings_module not in sys.modules:
+            from pyttings.static import read_static_settings
+
+            self._static = read_static_settings(self._settings_module)
+        self._type_hints: dict[str, Any] = {}
+        exported = self._load_exported_settings(lazy_load)
+        if exported is not None:
+            self._cache: dict[str, Any] = exported
+        else:
+            self._cache = {} if lazy_load else self._load_all_settings()
+        # Raw environment variable values the cached settings were loaded from
+        self._raw: dict[str, str | None] = {}
+        if self._cache:
+            self._raw = self._raw_values(self._cache, self._prefixed_environ())
 
     def _load_settings_module(self) -> str:
         """Get the settings module name from environment variable."""
@@ -31,55 +154,687 @@ class Settings:
             )
         return settings_module
 
-    @cached_property
+    @_locked_cached_property
     def _module(self):
         """Import and cache the settings module."""
-        return importlib.import_module(self._settings_module)
+        module = importlib.import_module(self._settings_module)
+        self._module_mtime = self._get_module_mtime(module)
+        return module
+
+    @staticmethod
+    def _get_module_mtime(module: types.ModuleType) -> int | None:
+        """Get the modification time of a module's file, if it has one."""
+        with suppress(OSError, TypeError):
+            return os.stat(module.__file__).st_mtime_ns  # type: ignore[arg-type]
+        return None
+
+    def _get_source_mtime(self) -> int | None:
+        """Get the modification time of the settings module's file, unimported."""
+        import importlib.util
+
+        with suppress(ImportError, ValueError, OSError):
+            spec = importlib.util.find_spec(self._settings_module)
+            if spec is not None and spec.origin:
+                return os.stat(spec.origin).st_mtime_ns
+        return None
+
+    @_locked_cached_property
+    def _annotations(self) -> dict[str, Any]:
+        """Get the raw, possibly unevaluated, annotations of the settings module."""
+        return getattr(self._module, "__annotations__", {})
+
+    def _get_type_hint(self, name: str) -> Any:
+        """
+        Resolve the type hint of a single setting, caching the result.
+
+        A hint that fails to evaluate is ignored, only affecting its own setting.
+        """
+        with suppress(KeyError):
+            return self._type_hints[name]
+
+        hint: Any = _MISSING
+        static = self._static_settings
+        if static is not None:
+            with suppress(Exception):
+                hint = self._evaluate_hint(static.eval_annotation(name), {})
+        # Import the module for hints that can't be resolved statically
+        if hint is _MISSING and (
+            static is None or name in static.annotations or name in static.dynamic_names
+        ):
+            hint = self._annotations.get(name, _MISSING)
+            if hint is not _MISSING:
+                try:
+                    hint = self._evaluate_hint(hint, vars(self._module))
+                except Exception:
+                    hint = _MISSING
+        self._type_hints[name] = hint
+        return hint
+
+    @staticmethod
+    def _evaluate_hint(hint: Any, namespace: dict[str, Any]) -> Any:
+        """
+        Evaluate the forward references of a type hint, nested ones included.
 
-    @cached_property
-    def _type_hints(self) -> dict[str, Any]:
-        """Get type hints from the settings module."""
-        with suppress(ImportError, ValueError, TypeError):
-            return get_type_hints(self._module)
-        return {}
+        As with `get_type_hints`, `None` becomes `NoneType` and `Annotated` is
+        stripped.
+        """
+        holder = types.SimpleNamespace(__annotations__={"hint": hint})
+        return get_type_hints(holder, namespace)["hint"]
 
-    @cached_property
+    @_locked_cached_property
+    def _validation_policies(self) -> dict[str, str]:
+        """Get the per-setting validation policies from the settings module."""
+        policies = self._get_module_attribute("__pyttings_validation__")
+        return {} if policies is _MISSING else policies
+
+    @staticmethod
+    def _is_setting_name(key: str) -> bool:
+        """Check if a settings module attribute name is a setting."""
+        return not key.startswith("__") and not key.endswith("__") and key.isupper()
+
+    @property
+    def _static_settings(self) -> "StaticSettings | None":
+        """Get the statically read settings module, unless it was imported since."""
+        return None if "_module" in self.__dict__ else self._static
+
+    def _get_module_attribute(self, name: str) -> Any:
+        """Get a settings module attribute, from its source when it's a literal."""
+        static = self._static_settings
+        if static is not None:
+            if static.is_undefined(name):
+                return _MISSING
+            value = static.get_value(name, _MISSING)
+            if value is not _MISSING:
+                return value
+        return getattr(self._module, name, _MISSING)
+
+    @_locked_cached_property
     def defaults(self) -> dict[str, Any]:
         """Get all uppercase attributes from the settings module as defaults."""
+        static = self._static_settings
+        if (
+            static is not None
+            and static.complete
+            and not any(map(self._is_setting_name, static.dynamic_names))
+        ):
+            return {
+                key: value
+                for key, value in static.values.items()
+                if self._is_setting_name(key)
+            }
         return {
             key: getattr(self._module, key)
             for key in dir(self._module)
-            if not key.startswith("__") and not key.endswith("__") and key.isupper()
+            if self._is_setting_name(key)
+        }
+
+    def _get_default(self, name: str) -> Any:
+        """Get the default of a single setting without building all the defaults."""
+        if "defaults" in self.__dict__:
+            return self.defaults.get(name, _MISSING)
+        if not self._is_setting_name(name):
+            return _MISSING
+        return self._get_module_attribute(name)
+
+    def _prefixed_environ(self) -> dict[str, str]:
+        """Index the environment variables matching the prefix by setting name."""
+        prefix, prefix_length = self._env_prefix, len(self._env_prefix)
+        return {
+            env_var_name[prefix_length:]: os.environ[env_var_name]
+            for env_var_name in os.environ
+            if env_var_name.startswith(prefix)
+            and env_var_name not in self.CONFIGURATION_KEYS
         }
 
+    @staticmethod
+    def _raw_values(
+        settings: dict[str, Any], environ: dict[str, str]
+    ) -> dict[str, str | None]:
+        """Get the raw environment variable values settings were loaded from."""
+        return {name: environ.get(name) for name in settings}
+
     def load_settings(self) -> dict[str, Any]:
-        """Load all settings from environment variables that match the prefix."""
-        return self.defaults | {
-            name: self.load_setting(name.replace(self._env_prefix, "", 1))
-            for name in os.environ
-            if name.startswith(self._env_prefix) and name not in self.CONFIGURATION_KEYS
+        """
+        Load all settings from environment variables that match the prefix.
+
+        Settings already loaded are reused as is, and overrides of custom classes
+        that can only be converted asynchronously are left out until `aload`.
+        """
+        return self._load_missing_settings(dict(self._cache))
+
+    def _async_only_names(self, environ: dict[str, str]) -> set[str]:
+        """Get the overridden settings only `aload` can convert."""
+        return {
+            name
+            for name in environ
+            if (conversion := self._get_conversion(name)) is not None
+            and is_async_only_custom_class(conversion[0])
+        }
+
+    def _load_missing_settings(self, loaded: dict[str, Any]) -> dict[str, Any]:
+        """
+        Complete already loaded settings with all the others.
+
+        Overrides of custom classes that can only be converted asynchronously are
+        left out, to be loaded by `aload`.
+        """
+        environ = {
+            name: value
+            for name, value in self._prefixed_environ().items()
+            if name not in loaded
         }
+        deferred = self._async_only_names(environ)
+        converted = self._convert_env_vars(
+            {name: value for name, value in environ.items() if name not in deferred}
+        )
+        defaults = {
+            name: value
+            for name, value in self.defaults.items()
+            if name not in loaded and name not in deferred
+        }
+        return defaults | converted | loaded
+
+    def _convert_env_vars(self, environ: dict[str, str]) -> dict[str, Any]:
+        """
+        Convert the environment variables of several settings.
+
+        With `load_workers`, custom classes are converted on a thread pool while
+        the other settings are converted in the calling thread. A pool is only
+        used for at least two custom classes, and errors are raised in the same
+        order as when converting serially.
+        """
+        pooled = []
+        if self._load_workers > 1:
+            pooled = [
+                name
+                for name in environ
+                if (conversion := self._get_conversion(name)) is not None
+                and is_custom_class(conversion[0])
+            ]
+        if len(pooled) < 2:
+            return {
+                name: self.convert_env_var(name, value)
+                for name, value in environ.items()
+            }
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(min(self._load_workers, len(pooled))) as executor:
+            futures = {
+                name: executor.submit(self.convert_env_var, name, environ[name])
+                for name in pooled
+            }
+            return {
+                name: futures[name].result()
+                if name in futures
+                else self.convert_env_var(name, value)
+                for name, value in environ.items()
+            }
+
+    def _fingerprint(self) -> str | None:
+        """Fingerprint everything the resolved settings depend on."""
+        from pyttings.cache import settings_fingerprint
+
+        return settings_fingerprint(
+            self._settings_module, self._env_prefix, self._validation
+        )
+
+    def _load_exported_settings(self, lazy_load: bool) -> dict[str, Any] | None:
+        """Load the settings exported by a parent process, if they still match."""
+        data = os.environ.get("PYTTINGS_EXPORTED_SETTINGS")
+        if data is None:
+            return None
+
+        from pyttings.cache import decode_settings
+
+        fingerprint = self._fingerprint()
+        exported = None if fingerprint is None else decode_settings(data, fingerprint)
+        if exported is None:
+            return None
+        values, excluded = exported
+        if lazy_load:
+            return values
+        return values | self._load_excluded_settings(excluded)
+
+    def _load_excluded_settings(self, excluded: list[str]) -> dict[str, Any]:
+        """
+        Load the settings left out of cached or exported ones, but for `aload`.
+
+        Only overridden settings may be left for `aload`, so the settings module
+        isn't imported to look up the conversion of the others.
+        """
+        environ = self._prefixed_environ()
+        deferred = self._async_only_names(
+            {name: environ[name] for name in excluded if name in environ}
+        )
+        return {
+            name: self.load_setting(name) for name in excluded if name not in deferred
+        }
+
+    def _load_all_settings(self) -> dict[str, Any]:
+        """Load all settings, through the on-disk cache if one is configured."""
+        if self._cache_dir is None:
+            return self._load_missing_settings({})
+
+        from pyttings.cache import read_cache, write_cache
+
+        fingerprint = self._fingerprint()
+        if fingerprint is None:
+            return self._load_missing_settings({})
+
+        path = os.path.join(self._cache_dir, self._cache_file_name())
+        cached = read_cache(path, fingerprint)
+        if cached is not None:
+            values, excluded = cached
+            return values | self._load_excluded_settings(excluded)
+
+        settings = self._load_missing_settings({})
+        write_cache(path, fingerprint, settings, self._volatile_names(settings))
+        return settings
+
+    def _cache_file_name(self) -> str:
+        """Name the cache file of the settings module and prefix, safely for paths."""
+        import hashlib
+
+        prefix_digest = hashlib.sha256(self._env_prefix.encode()).hexdigest()[:16]
+        return f"{self._settings_module}-{prefix_digest}.pickle"
+
+    def _volatile_names(self, settings: dict[str, Any]) -> list[str]:
+        """
+        Get the settings whose value may change without the fingerprint changing.
+
+        The fingerprint only covers the settings module's file, not what its
+        defaults are computed from, e.g. environment variables without the prefix.
+        So only environment variable overrides and defaults that are literals in
+        the settings module's source, never referred to again after their
+        assignment (e.g. to `.append()` to them), can be reused by another process.
+        """
+        from pyttings.static import read_static_settings
+
+        environ = self._prefixed_environ()
+        static = self._static or read_static_settings(self._settings_module)
+        return [
+            name
+            for name in settings
+            if name not in environ
+            and (
+                static is None
+                or not static.complete
+                or static.get_value(name, _MISSING) is _MISSING
+            )
+        ]
 
     def get_env_var(self, name: str) -> Any | None:
         """Get and convert environment variable for a setting."""
-        env_var_name = f"{self._env_prefix}{name}"
-        value = os.getenv(env_var_name)
+        value = self._get_raw(name)
+        return value if value is None else self.convert_env_var(name, value)
+
+    def _get_conversion(self, name: str) -> tuple[Any, str | None] | None:
+        """Get the expected type and validation policy of a setting, if it has one."""
+        default = self._get_default(name)
+        if default is _MISSING:
+            return None
+        expected_type = self._get_type_hint(name)
+        if expected_type is _MISSING:
+            expected_type = type(default)
+        if isinstance(default, (array, memoryview)) and expected_type in ARRAY_TYPES:
+            # Bare array hints keep the default's type code
+            typecode = (
+                default.typecode if isinstance(default, array) else default.format
+            )
+            if typecode in typecodes:
+                expected_type = types.GenericAlias(expected_type, (typecode,))
+        return expected_type, self._validation_policies.get(name, self._validation)
+
+    def convert_env_var(self, name: str, value: str) -> Any:
+        """Convert the raw environment variable value of a setting."""
+        conversion = self._get_conversion(name)
+        if conversion is None:
+            return value
+        return get_cached_converter(*conversion)(name, value)
 
-        if value is None or name not in self.defaults:
+    async def aconvert_env_var(self, name: str, value: str) -> Any:
+        """Convert the raw environment variable value of a setting asynchronously."""
+        conversion = self._get_conversion(name)
+        if conversion is None:
             return value
-        expected_type = self._type_hints.get(name, type(self.defaults[name]))
-        return convert_and_validate(name, value, expected_type)
+        return await aconvert(name, value, *conversion)
 
     def load_setting(self, name: str) -> Any:
         """Load a single setting from environment variable defaulting to the default."""
-        value: Any | None = self.get_env_var(name)
-        if value is None and name not in self.defaults:
+        return self._load_raw_setting(name, self._get_raw(name))
+
+    def _get_raw(self, name: str) -> str | None:
+        """Get the raw environment variable value of a setting, if set."""
+        env_var_name = f"{self._env_prefix}{name}"
+        if env_var_name in self.CONFIGURATION_KEYS:
+            return None
+        return os.environ.get(env_var_name)
+
+    def _load_raw_setting(self, name: str, raw: str | None) -> Any:
+        """Load a single setting from its raw environment variable value, if set."""
+        if raw is not None:
+            return self.convert_env_var(name, raw)
+
+        default = self._get_default(name)
+        if default is _MISSING:
             raise AttributeError(
                 f"'{self.__class__.__name__}' object has no attribute '{name}'"
             )
-        return value if value is not None else self.defaults[name]
+        return default
+
+    async def aload(self) -> None:
+        """
+        Resolve every setting concurrently, without blocking the event loop.
+
+        Custom classes with a `__pyttings_aconvert__` coroutine method are
+        converted with it, other custom classes in worker threads, so slow
+        conversions overlap. The resolved settings are cached for later access.
+
+        Settings already loaded are kept as is. When not loading lazily, that's
+        every setting but the overrides of custom classes with only an
+        asynchronous conversion method, so use lazy loading for the other
+        conversions to overlap too.
+        """
+        import asyncio
+
+        environ = {
+            name: value
+            for name, value in self._prefixed_environ().items()
+            if name not in self._cache
+        }
+        converted = await asyncio.gather(
+            *(self.aconvert_env_var(name, value) for name, value in environ.items())
+        )
+        defaults = {
+            name: value
+            for name, value in self.defaults.items()
+            if name not in self._cache
+        }
+        values = defaults | dict(zip(environ, converted))
+        self._raw.update(self._raw_values(values, environ))
+        self._cache.update(values)
+
+    def freeze(self) -> FrozenSettings:
+        """
+        Resolve every setting into a read-only snapshot.
+
+        Values are stored in `__slots__` of a generated class, so reads are plain
+        attribute loads without going through `__getattr__`. Settings already
+        loaded, e.g. by `aload`, are reused. The snapshot doesn't follow later
+        changes to the environment.
+        """
+        values = {
+            key: value
+            for key, value in self.load_settings().items()
+            if key.isidentifier()
+        }
+        frozen_class = type(
+            f"Frozen{self.__class__.__name__}",
+            (FrozenSettings,),
+            {"__slots__": tuple(values)},
+        )
+        snapshot: FrozenSettings = object.__new__(frozen_class)
+        for key, value in values.items():
+            object.__setattr__(snapshot, key, value)
+        return snapshot
+
+    def export_for_children(self) -> str:
+        """
+        Export the resolved settings to child processes started from now on.
+
+        The settings are encoded into the `PYTTINGS_EXPORTED_SETTINGS` environment
+        variable, which children inherit with any start method. A child's `Settings`
+        then loads them directly, as long as the settings module, the pyttings
+        sources and the relevant environment variables are unchanged. Values that
+        aren't built-in types, like custom classes, and defaults that aren't
+        literals in the settings module, or are changed after their assignment,
+        are loaded again in the child. Returns the encoded settings, e.g. to pass
+        in a custom environment.
+
+        The encoded settings are kept under `EXPORT_MAX_SIZE`, as processes can't
+        be started with larger environment variables. Environment variable
+        overrides, which children inherit anyway, are converted again in the child
+        instead of being exported, largest first, until they fit.
+        """
+        from pyttings.cache import EXPORT_MAX_SIZE, encode_settings
+
+        fingerprint = self._fingerprint()
+        if fingerprint is None:
+            raise ValueError(
+                f"Cannot export settings, the settings module "
+                f"'{self._settings_module}' file was not found."
+            )
+        settings = self.load_settings()
+        volatile = self._volatile_names(settings)
+        environ = self._prefixed_environ()
+        overrides = sorted(
+            (name for name in settings if name in environ),
+            key=lambda name: len(environ[name]),
+        )
+        data = encode_settings(fingerprint, settings, volatile)
+        while len(data) > EXPORT_MAX_SIZE and overrides:
+            volatile.append(overrides.pop())
+            data = encode_settings(fingerprint, settings, volatile)
+        if len(data) > EXPORT_MAX_SIZE:
+            raise ValueError(
+                f"Cannot export settings, they take {len(data)} bytes once encoded, "
+                f"more than the {EXPORT_MAX_SIZE} bytes an environment variable can "
+                f"safely hold."
+            )
+        os.environ["PYTTINGS_EXPORTED_SETTINGS"] = data
+        return data
+
+    def prepare_for_fork(self) -> None:
+        """
+        Resolve every setting and freeze it in memory before forking workers.
+
+        Settings already loaded, e.g. by `aload`, aren't converted again.
+        Collections are replaced with immutable equivalents (tuples, frozensets and
+        read-only mapping proxies), structures only needed while loading are
+        dropped and every object is moved out of reach of the garbage collector
+        with `gc.freeze()`, so workers keep sharing the pages they're stored in.
+        """
+        import gc
+
+        loaded = dict(self._cache)
+        settings = self._load_missing_settings(loaded)
+        self._raw = self._raw_values(settings, self._prefixed_environ()) | {
+            name: raw for name, raw in self._raw.items() if name in loaded
+        }
+        self._cache = {key: make_immutable(value) for key, value in settings.items()}
+        self._type_hints = {}
+        for name in ("defaults", "_annotations", "_validation_policies"):
+            self.__dict__.pop(name, None)
+        gc.collect()
+        gc.freeze()
+
+    def reload(self, check_module: bool = False) -> list[str]:
+        """
+        Refresh the loaded settings from the environment.
+
+        Only settings whose environment variable changed since they were loaded are
+        converted again, along with new ones when not loading lazily. With
+        `check_module`, a settings module whose file was modified since it was
+        imported or read is reloaded too, and every loaded setting is refreshed. The
+        refreshed settings are swapped in at once, so concurrent readers see either
+        the old or the new values, and nothing changes if a conversion fails.
+        Subscribers of the changed settings are then notified, see `subscribe`.
+        Returns the names of the settings whose value changed.
+        """
+        with self._reload_lock:
+            changes = self._reload(check_module)
+            self._notify(changes)
+            return sorted(changes)
+
+    def subscribe(
+        self,
+        pattern: str,
+        callback: SettingCallback,
+        executor: "Executor | None" = None,
+    ) -> Callable[[], None]:
+        """
+        Call `callback` whenever a reload changes the value of matching settings.
+
+        `pattern` is a setting name or a shell-style pattern, like `DB_*` for every
+        setting with the `DB_` prefix. The callback gets the setting name, its old
+        value and its new value, `None` for a setting that was added or removed.
+        Callbacks run once the new settings are swapped in, in the reloading thread
+        unless an `executor` is given. Reading settings is unaffected by
+        subscriptions. Returns a function that cancels the subscription.
+        """
+        import fnmatch
+        import re
+
+        subscription = (
+            re.compile(fnmatch.translate(pattern)).match,
+            callback,
+            executor,
+        )
+        with self._lock:
+            self._subscriptions = (*self._subscriptions, subscription)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._subscriptions = tuple(
+                    other for other in self._subscriptions if other is not subscription
+                )
+
+        return unsubscribe
+
+    def _notify(self, changes: dict[str, tuple[Any, Any]]) -> None:
+        """
+        Call the subscribers of changed settings, in setting name order.
+
+        A failing callback doesn't prevent the others from being called, the first
+        error is raised once they all were.
+        """
+        errors = []
+        for name in sorted(changes):
+            old, new = (None if value is _MISSING else value for value in changes[name])
+            for match, callback, executor in self._subscriptions:
+                if not match(name):
+                    continue
+                if executor is not None:
+                    executor.submit(callback, name, old, new)
+                    continue
+                try:
+                    callback(name, old, new)
+                except Exception as error:
+                    errors.append(error)
+        if errors:
+            raise errors[0]
+
+    def _reload(self, check_module: bool) -> dict[str, tuple[Any, Any]]:
+        """Reload the settings, returning the old and new values of changed ones."""
+        cache, raw = self._cache, self._raw
+        environ = self._prefixed_environ()
+        if check_module and self._reload_module_if_modified():
+            names = set(cache)
+            if not self._lazy_load:
+                names |= self.defaults.keys()
+        else:
+            names = {name for name in cache if environ.get(name) != raw.get(name)}
+        if not self._lazy_load:
+            names |= environ.keys() - cache.keys() - self._async_only_names(environ)
+
+        converted = self._convert_env_vars(
+            {name: environ[name] for name in names if name in environ}
+        )
+        new_cache, new_raw = dict(cache), dict(raw)
+        for name in names:
+            value = converted.get(name, _MISSING)
+            if value is _MISSING:
+                value = self._get_default(name)
+            if value is _MISSING:
+                new_cache.pop(name, None)
+                new_raw.pop(name, None)
+            else:
+                new_cache[name] = value
+                new_raw[name] = environ.get(name)
+        self._raw = new_raw
+        self._cache = new_cache
+
+        changes = {}
+        for name in names:
+            old, new = cache.get(name, _MISSING), new_cache.get(name, _MISSING)
+            if old is not new and (old is _MISSING or new is _MISSING or old != new):
+                changes[name] = (old, new)
+        return changes
+
+    def _reload_module_if_modified(self) -> bool:
+        """
+        Reload the settings module if its file was modified since it was read.
+
+        A module that wasn't imported, as settings were read from its source or
+        exported or cached settings, is read again from its source or imported.
+        """
+        imported = "_module" in self.__dict__
+        if imported:
+            mtime = self._get_module_mtime(self._module)
+        elif self._module_mtime is not None:
+            mtime = self._get_source_mtime()
+        else:
+            return False
+        if mtime is None or mtime == self._module_mtime:
+            return False
+        with self._build_lock:
+            if imported:
+                importlib.reload(self._module)
+            else:
+                if self._static is not None:
+                    from pyttings.static import read_static_settings
+
+                    self._static = read_static_settings(self._settings_module)
+                # Imported by someone else, it would be imported as it was
+                if self._settings_module in sys.modules:
+                    importlib.reload(sys.modules[self._settings_module])
+            self._module_mtime = mtime
+            self._type_hints = {}
+            for name in ("defaults", "_annotations", "_validation_policies"):
+                self.__dict__.pop(name, None)
+        return True
+
+    def install_reload_handler(
+        self, signum: int | None = None, check_module: bool = False
+    ) -> None:
+        """
+        Reload the settings whenever the process receives a signal.
+
+        The signal defaults to `SIGHUP`, as is customary for daemons. Reloading
+        happens in a separate thread, as signal handlers interrupt the main thread
+        at any point, possibly while it holds a lock reloading needs.
+        """
+        import signal
+
+        def handler(received: int, frame: types.FrameType | None) -> None:
+            threading.Thread(
+                target=self.reload,
+                args=(check_module,),
+                name="pyttings-reload",
+                daemon=True,
+            ).start()
+
+        signal.signal(signal.SIGHUP if signum is None else signum, handler)
 
     def __getattr__(self, name: str) -> Any:
-        if name not in self._cache:
-            self._cache[name] = self.load_setting(name)
-        return self._cache[name]
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        # Single-flight: concurrent lookups of a key wait for the first one
+        with self._lock:
+            key_lock = self._key_locks.setdefault(name, threading.RLock())
+        try:
+            with key_lock:
+                with suppress(KeyError):
+                    return self._cache[name]
+                raw = self._get_raw(name)
+                value = self._cache[name] = self._load_raw_setting(name, raw)
+                self._raw[name] = raw
+                return value
+        finally:
+            with self._lock:
+                if self._key_locks.get(name) is key_lock:
+                    del self._key_locks[name]
@@ -0,0 +1,123 @@
+import threading
+import types
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Iterator
+
+from pyttings.core import Settings, _locked_cached_property
+from pyttings.type_converter import aconvert, get_cached_converter
+
+# Called with the metric, the setting (None for the module import) and the value
+StatsHook = Callable[[str, str | None, float], None]
+
+# Metrics counting the union retries and custom class calls of a setting
+EVENT_COUNT_METRICS = {
+    "union_retry": "union_retries",
+    "custom_class": "custom_class_calls",
+}
+
+_converting: ContextVar[tuple["InstrumentedSettings", str] | None] = ContextVar(
+    "_converting", default=None
+)
+
+
+def _record_conversion_event(event: str, seconds: float) -> None:
+    """Attribute a union retry or custom class call to the setting being converted."""
+    converting = _converting.get()
+    if converting is not None:
+        settings, name = converting
+        settings._record(EVENT_COUNT_METRICS[event], name, 1)
+        settings._record(f"{event}_seconds", name, seconds)
+
+
+class InstrumentedSettings(Settings):
+    """
+    Settings recording where loading time goes, per setting.
+
+    Records the settings module import, type hint resolution and conversion times,
+    union retries, custom class calls and cache hits and misses. They're available
+    from `stats()` and are forwarded to `hook` as they happen. Enabled with
+    `PYTTINGS_INSTRUMENT`, plain `Settings` carry no instrumentation.
+    """
+
+    def __init__(self, *args: Any, hook: StatsHook | None = None, **kwargs: Any):
+        self._hook: StatsHook | None = hook
+        self._stats_lock = threading.Lock()
+        self._import_seconds: float | None = None
+        self._setting_stats: dict[str, dict[str, float]] = {}
+        super().__init__(*args, **kwargs)
+
+    def set_hook(self, hook: StatsHook | None) -> None:
+        """Forward every recorded metric to a callback, e.g. a metrics client."""
+        self._hook = hook
+
+    def stats(self) -> dict[str, Any]:
+        """Get the recorded metrics, per setting."""
+        with self._stats_lock:
+            return {
+                "import_seconds": self._import_seconds,
+                "settings": {
+                    name: dict(metrics) for name, metrics in self._setting_stats.items()
+                },
+            }
+
+    def _record(self, metric: str, name: str | None, value: float) -> None:
+        with self._stats_lock:
+            if name is None:
+                self._import_seconds = value
+            else:
+                metrics = self._setting_stats.setdefault(name, {})
+                metrics[metric] = metrics.get(metric, 0) + value
+        if self._hook is not None:
+            self._hook(metric, name, value)
+
+    @contextmanager
+    def _timed(self, metric: str, name: str | None) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._record(metric, name, perf_counter() - start)
+
+    @_locked_cached_property
+    def _module(self) -> types.ModuleType:
+        with self._timed("import_seconds", None):
+            return Settings._module.func(self)
+
+    def _get_type_hint(self, name: str) -> Any:
+        if name in self._type_hints:
+            return self._type_hints[name]
+        with self._timed("type_hint_seconds", name):
+            return super()._get_type_hint(name)
+
+    def convert_env_var(self, name: str, value: str) -> Any:
+        conversion = self._get_conversion(name)
+        if conversion is None:
+            return value
+        converter = get_cached_converter(*conversion, _record_conversion_event)
+        token = _converting.set((self, name))
+        try:
+            with self._timed("conversion_seconds", name):
+                return converter(name, value)
+        finally:
+            _converting.reset(token)
+
+    async def aconvert_env_var(self, name: str, value: str) -> Any:
+        conversion = self._get_conversion(name)
+        if conversion is None:
+            return value
+        token = _converting.set((self, name))
+        try:
+            with self._timed("conversion_seconds", name):
+                return await aconvert(
+                    name, value, *conversion, _record_conversion_event
+                )
+        finally:
+            _converting.reset(token)
+
+    def __getattr__(self, name: str) -> Any:
+        if self._is_setting_name(name):
+            hit = name in self._cache
+            self._record("cache_hits" if hit else "cache_misses", name, 1)
+        return super().__getattr__(name)
@@ -0,0 +1,196 @@
+import ast
+import builtins
+import importlib.util
+import typing
+from contextlib import suppress
+from typing import Any, NamedTuple
+
+_STATIC_HINT_NAMESPACE: dict[str, Any] = {"__builtins__": builtins}
+
+
+class StaticSettings(NamedTuple):
+    """Settings read from the source of a settings module without importing it."""
+
+    values: dict[str, Any]
+    annotations: dict[str, str]
+    dynamic_names: set[str]
+    typing_names: dict[str, str]
+    complete: bool
+
+    def get_value(self, name: str, default: Any) -> Any:
+        """Get the literal value of a name, or `default` if it isn't known."""
+        if name in self.dynamic_names:
+            return default
+        return self.values.get(name, default)
+
+    def is_undefined(self, name: str) -> bool:
+        """Check if a name is certainly not defined by the settings module."""
+        return (
+            self.complete and name not in self.values and name not in self.dynamic_names
+        )
+
+    def eval_annotation(self, name: str) -> Any:
+        """
+        Evaluate the annotation of a name using only builtins and `typing`.
+
+        Raises NameError if it refers to names the settings module defines itself.
+        """
+        annotation = self.annotations[name]
+        for node in ast.walk(ast.parse(annotation, mode="eval")):
+            if (
+                isinstance(node, ast.Name)
+                and node.id not in self.typing_names
+                and (node.id in self.values or node.id in self.dynamic_names)
+            ):
+                raise NameError(f"'{node.id}' is defined by the settings module")
+
+        namespace = _STATIC_HINT_NAMESPACE | {
+            alias: getattr(typing, attr) if attr else typing
+            for alias, attr in self.typing_names.items()
+        }
+        return eval(annotation, namespace)
+
+
+# Calls that may define module attributes no statement shows
+_DYNAMIC_CALLS = {"globals", "vars", "locals", "exec", "setattr"}
+
+
+def _stored_names(node: ast.AST) -> set[str]:
+    """Get the names a statement may bind, including in nested blocks."""
+    names = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+            names.add(child.id)
+        elif isinstance(child, (ast.Import, ast.ImportFrom)):
+            names.update(
+                alias.asname or alias.name.partition(".")[0]
+                for alias in child.names
+                if alias.name != "*"
+            )
+        elif isinstance(
+            child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Global)
+        ):
+            names.update(child.names if isinstance(child, ast.Global) else [child.name])
+        elif isinstance(child, (ast.ExceptHandler, ast.MatchAs, ast.MatchStar)):
+            if child.name is not None:
+                names.add(child.name)
+        elif isinstance(child, ast.MatchMapping) and child.rest is not None:
+            names.add(child.rest)
+    return names
+
+
+def _referenced_names(node: ast.AST) -> set[str]:
+    """Get the names a statement reads or deletes, outside of annotations."""
+    names = set()
+    nodes = [node]
+    while nodes:
+        child = nodes.pop()
+        if isinstance(child, ast.Name) and not isinstance(child.ctx, ast.Store):
+            names.add(child.id)
+        annotations = [
+            getattr(child, field, None) for field in ("annotation", "returns")
+        ]
+        nodes.extend(
+            grandchild
+            for grandchild in ast.iter_child_nodes(child)
+            if not any(grandchild is annotation for annotation in annotations)
+        )
+    return names
+
+
+def _may_define_hidden_names(tree: ast.AST) -> bool:
+    """Check if a module may define names that can't be found statically."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and any(
+            alias.name == "*" for alias in node.names
+        ):
+            return True
+        if (
+            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name == "__getattr__"
+        ):
+            return True
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in _DYNAMIC_CALLS
+        ):
+            return True
+    return False
+
+
+def parse_settings_source(source: str) -> StaticSettings:
+    """
+    Extract the literal assignments and annotations of a settings module's source.
+
+    Names bound any other way (imports, computed values, compound statements) are
+    reported as dynamic, as are literals the module refers to anywhere else, since
+    they may be changed after their assignment, e.g. with `.append()`, subscript
+    assignments or `del`. The result is incomplete if the module may define names
+    that can't be found statically, e.g. through star imports or `globals()`.
+    """
+    values: dict[str, Any] = {}
+    annotations: dict[str, str] = {}
+    dynamic_names: set[str] = set()
+    typing_names: dict[str, str] = {}
+    tree = ast.parse(source)
+
+    for node in tree.body:
+        if isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+                annotations[node.target.id] = ast.unparse(node.annotation)
+            if node.value is None:
+                continue
+            names = [target.id for target in targets if isinstance(target, ast.Name)]
+            if len(names) != len(targets):
+                dynamic_names.update(*map(_stored_names, targets))
+                continue
+            try:
+                value = ast.literal_eval(node.value)
+            except (SyntaxError, ValueError, TypeError, MemoryError, RecursionError):
+                # Walrus expressions in the value may bind names too
+                dynamic_names.update(names, _stored_names(node.value))
+            else:
+                values.update(dict.fromkeys(names, value))
+        elif isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if node.module == "typing" and not node.level:
+                    typing_names[alias.asname or alias.name] = alias.name
+                dynamic_names.add(alias.asname or alias.name)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name == "typing":
+                    typing_names[alias.asname or alias.name] = ""
+                dynamic_names.add(alias.asname or alias.name.partition(".")[0])
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            dynamic_names.add(node.name)
+            # Names declared global may be defined when the function is called
+            dynamic_names.update(
+                name
+                for child in ast.walk(node)
+                if isinstance(child, ast.Global)
+                for name in child.names
+            )
+        else:
+            dynamic_names.update(_stored_names(node))
+
+    for name in _referenced_names(tree) & values.keys():
+        del values[name]
+        dynamic_names.add(name)
+
+    complete = not _may_define_hidden_names(tree)
+    return StaticSettings(values, annotations, dynamic_names, typing_names, complete)
+
+
+def read_static_settings(module_name: str) -> StaticSettings | None:
+    """Read a settings module's source without executing it, if it can be found."""
+    with suppress(ImportError, ValueError):
+        spec = importlib.util.find_spec(module_name)
+        if spec is not None and spec.origin and spec.origin.endswith(".py"):
+            with suppress(OSError, SyntaxError, ValueError):
+                with open(spec.origin, "rb") as source:
+                    return parse_settings_source(
+                        importlib.util.decode_source(source.read())
+                    )
+    return None
@@ -1,38 +1,196 @@
-import ast
-import inspect
 import os
+import threading
 import types
+from array import array, typecodes
+from collections import OrderedDict
 from contextlib import suppress
-from typing import Any, Type, TypeVar, Union, get_args, get_origin
+from itertools import islice
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from pyttings.exceptions import SettingMisconfigured
 
 CollectionT = TypeVar("CollectionT", list, tuple, set, dict)
+Converter = Callable[[str, str], Any]
+LiteralMatcher = Callable[[Any], Any]
+Validator = Callable[[Any], bool]
+ConversionObserver = Callable[[str, float], None]
 CONTAINER_TYPES = {list, tuple, set, dict}
 UNION_TYPES = {types.UnionType, Union}
+CONTAINER_PARSERS = {"auto", "json", "literal"}
+STREAMABLE_CONTAINER_DELIMITERS: dict[type, tuple[str, str]] = {
+    tuple: ("(", ")"),
+    set: ("{", "}"),
+}
+STREAMABLE_ELEMENT_TYPES = {str, int, float}
+ARRAY_TYPES = {array, memoryview}
+ARRAY_TYPECODES = {int: "q", float: "d"}
+STREAMING_MIN_LENGTH = 64 * 1024
+IMMUTABLE_TYPES = {types.NoneType, bool, int, float, complex, str, bytes}
+CACHEABLE_CLASS_ATTRIBUTE = "__pyttings_cacheable__"
 
 CUSTOM_CLASS_METHOD_NAME = os.getenv(
     "PYTTING_CUSTOM_CLASS_METHOD_NAME", "__pyttings_convert__"
 )
+CUSTOM_CLASS_ASYNC_METHOD_NAME = os.getenv(
+    "PYTTINGS_CUSTOM_CLASS_ASYNC_METHOD_NAME", "__pyttings_aconvert__"
+)
+VALIDATION = os.getenv("PYTTINGS_VALIDATION", "full")
+CONVERSION_CACHE_SIZE = int(os.getenv("PYTTINGS_CONVERSION_CACHE_SIZE", "256"))
+CONTAINER_PARSER = os.getenv("PYTTINGS_CONTAINER_PARSER", "auto").lower()
+if CONTAINER_PARSER not in CONTAINER_PARSERS:
+    raise ValueError(
+        f"Invalid 'PYTTINGS_CONTAINER_PARSER' value '{CONTAINER_PARSER}'.\n"
+        f"Expected one of {sorted(CONTAINER_PARSERS)}."
+    )
+
+_INVALID_LITERAL = object()
+_UNPARSED = object()
+_WHITESPACE = " \t\n\r"
+_JSON_ONLY_TOKENS = ("\\", "true", "false", "null")
+_converters: dict[Any, Converter] = {}
+_validators: dict[Any, Validator] = {}
+_custom_class_descriptors: dict[tuple[type, str], tuple[Callable, Any]] = {}
+_observed_converters: dict[Any, Converter] = {}
+_cached_converters: dict[Any, Converter] = {}
+_conversion_cache: OrderedDict[tuple[Any, str], Any] = OrderedDict()
+_conversion_cache_lock = threading.Lock()
+_conversion_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
 
 
 def is_custom_class(expected_type: type) -> bool:
-    """Check if a type has a custom conversion method."""
-    return hasattr(expected_type, CUSTOM_CLASS_METHOD_NAME) and callable(
-        getattr(expected_type, CUSTOM_CLASS_METHOD_NAME)
+    """Check if a type has a custom conversion method, synchronous or not."""
+    return (
+        hasattr(expected_type, CUSTOM_CLASS_METHOD_NAME)
+        and callable(getattr(expected_type, CUSTOM_CLASS_METHOD_NAME))
+    ) or is_async_custom_class(expected_type)
+
+
+def is_async_custom_class(expected_type: type) -> bool:
+    """Check if a type has an asynchronous custom conversion method."""
+    return hasattr(expected_type, CUSTOM_CLASS_ASYNC_METHOD_NAME) and callable(
+        getattr(expected_type, CUSTOM_CLASS_ASYNC_METHOD_NAME)
+    )
+
+
+def is_async_only_custom_class(expected_type: type) -> bool:
+    """Check if a type can only be converted with its asynchronous method."""
+    return is_async_custom_class(expected_type) and not callable(
+        getattr(expected_type, CUSTOM_CLASS_METHOD_NAME, None)
     )
 
 
+def parse_literal(value: str) -> Any:
+    """
+    Parse a string as a container literal, returning a sentinel if it isn't one.
+
+    Depending on `CONTAINER_PARSER`, JSON is tried first (`auto`), exclusively
+    (`json`) or never (`literal`), Python-only syntax requires ast.literal_eval.
+    With `auto`, values JSON and Python literals may read differently (`true`,
+    `false`, `null`, `NaN`, `Infinity` and string escapes) are left to
+    ast.literal_eval, so the result doesn't depend on the parser used.
+    """
+    if CONTAINER_PARSER != "literal" and value.lstrip()[:1] in ("[", "{"):
+        import json
+
+        with suppress(ValueError, RecursionError):
+            if CONTAINER_PARSER == "json":
+                return json.loads(value)
+            if not any(token in value for token in _JSON_ONLY_TOKENS):
+                return json.loads(value, parse_constant=_reject_constant)
+    if CONTAINER_PARSER == "json":
+        return _INVALID_LITERAL
+
+    import ast
+
+    with suppress(SyntaxError, ValueError, TypeError):
+        return ast.literal_eval(value)
+    return _INVALID_LITERAL
+
+
 def convert_container(
     value: str, expected_type: Type[CollectionT]
 ) -> CollectionT | None:
-    """Try to convert a string to a container type using ast.literal_eval."""
-    with suppress(SyntaxError, ValueError, TypeError):
-        parsed_value = ast.literal_eval(value)
-        return (
-            expected_type(parsed_value)
-            if isinstance(parsed_value, expected_type)
-            else None
+    """Try to convert a string to a container type using parse_literal."""
+    parsed_value = parse_literal(value)
+    return parsed_value if isinstance(parsed_value, expected_type) else None
+
+
+def _skip_whitespace(value: str, index: int) -> int:
+    while index < len(value) and value[index] in _WHITESPACE:
+        index += 1
+    return index
+
+
+def _reject_constant(constant: str) -> Any:
+    raise ValueError(f"Unexpected constant {constant}")
+
+
+def iter_collection_elements(
+    value: str, container_type: type, element_type: type
+) -> Iterator[Any]:
+    """
+    Parse a flat tuple or set literal element by element.
+
+    Unlike ast.literal_eval, no syntax tree is built for the whole value. Elements
+    must be JSON scalars of exactly `element_type`, a ValueError is raised as soon
+    as one isn't or the collection syntax is invalid. Anything JSON and Python
+    literals read differently, `NaN`, `Infinity` and strings with escapes, raises
+    a ValueError too, so the regular parser decides on those.
+    """
+    import json
+
+    raw_decode = json.JSONDecoder(parse_constant=_reject_constant).raw_decode
+    opening, closing = STREAMABLE_CONTAINER_DELIMITERS[container_type]
+    index = _skip_whitespace(value, 0)
+    if value[index : index + 1] != opening:
+        raise ValueError("Unexpected collection opening")
+    index = _skip_whitespace(value, index + 1)
+
+    count, trailing_comma = 0, False
+    while value[index : index + 1] != closing:
+        element, end = raw_decode(value, index)
+        if type(element) is not element_type:
+            raise ValueError(f"Unexpected element {element!r}")
+        if element_type is str and "\\" in value[index:end]:
+            raise ValueError("String escapes require the regular parser")
+        index = end
+        yield element
+        count += 1
+
+        index = _skip_whitespace(value, index)
+        trailing_comma = value[index : index + 1] == ","
+        if trailing_comma:
+            index = _skip_whitespace(value, index + 1)
+        elif value[index : index + 1] != closing:
+            raise ValueError("Expected a separator")
+
+    if index + 1 != len(value.rstrip()):
+        raise ValueError("Unexpected data after the collection")
+    if container_type is tuple and count == 1 and not trailing_comma:
+        raise ValueError("A single element tuple requires a trailing comma")
+    if container_type is set and count == 0:
+        raise ValueError("An empty set can't be written as a literal")
+
+
+def stream_collection(
+    value: str, container_type: Type[CollectionT], element_type: type
+) -> CollectionT | None:
+    """Build a flat collection in a single pass over its elements, if possible."""
+    with suppress(ValueError, RecursionError):
+        return container_type(
+            iter_collection_elements(value, container_type, element_type)
         )
     return None
 
@@ -49,46 +207,178 @@ def parse_bool(value: str) -> bool:
     raise ValueError(f"Cannot parse '{value}' as boolean")
 
 
+def parse_validation_policy(policy: str) -> int | None:
+    """
+    Parse a validation policy into the number of elements to check per container.
+
+    `full` checks every element (None), `off` none of them (0) and `sampled:N`
+    only N elements spread over the container.
+    """
+    mode, _, size = policy.lower().partition(":")
+    if mode == "full" and not size:
+        return None
+    if mode == "off" and not size:
+        return 0
+    if mode == "sampled" and size.isdigit() and int(size) > 0:
+        return int(size)
+    raise ValueError(
+        f"Invalid validation policy '{policy}'.\nExpected 'full', 'off' or 'sampled:N'."
+    )
+
+
+def sample_elements(value: Any, size: int) -> Iterable[Any]:
+    """Pick at most `size` elements, evenly spread for sequences."""
+    if len(value) <= size:
+        return value
+    if isinstance(value, (list, tuple)):
+        return value[:: len(value) // size][:size]
+    return islice(value, size)
+
+
 def validate_container_types(
-    value: Any, container_type: Type[CollectionT], arg_types: tuple | None
+    value: Any,
+    container_type: Type[CollectionT],
+    arg_types: tuple | None,
+    validation: str | None = None,
 ) -> bool:
     """Validate that container elements match their expected types."""
     if arg_types is None:
         return True
 
-    if container_type is dict:
-        if not isinstance(value, dict):
-            return False
-        key_type, value_type = arg_types
-        return all(
-            isinstance(k, key_type) and isinstance(v, value_type)
-            for k, v in value.items()
-        )
+    if container_type not in CONTAINER_TYPES:
+        return False
+
+    return get_validator(types.GenericAlias(container_type, arg_types), validation)(
+        value
+    )
+
+
+def _accept(value: Any) -> bool:
+    return True
+
 
-    if container_type in {list, tuple, set}:
-        if not isinstance(value, container_type):
-            return False
-        element_type = arg_types[0]
-        return all(isinstance(x, element_type) for x in value)
+def compile_container_validator(
+    container_type: Type[CollectionT], arg_types: tuple[Any, ...], validation: str
+) -> Validator:
+    """
+    Build a validator for a parameterized container and, recursively, its elements.
 
-    return False
+    Tuples are either fixed, like `tuple[int, str]` and `tuple[int]` (exactly one
+    element), or variadic, like `tuple[int, ...]`. The validation policy limits how
+    many elements of each container are checked.
+    """
+    sample_size = parse_validation_policy(validation)
+    if sample_size == 0:
+        return lambda value: isinstance(value, container_type)
 
+    def elements(value: Any) -> Iterable[Any]:
+        return value if sample_size is None else sample_elements(value, sample_size)
 
-def handle_union_type(name: str, value: str, union_type: type) -> Any:
-    """Try to convert the value to any of the types in the union."""
-    for candidate_type in get_args(union_type):
-        with suppress(SettingMisconfigured):
-            return convert_and_validate(name, value, candidate_type)
+    if not arg_types and container_type is not tuple:
+        return lambda value: isinstance(value, container_type)
 
-    raise SettingMisconfigured(
-        f"Invalid type for {name} with configured value '{value}'. "
-        f"Expected one of {get_args(union_type)}."
+    if container_type is dict:
+        if len(arg_types) != 2:
+            return lambda value: False
+        validate_key, validate_value = (
+            get_validator(arg_type, validation) for arg_type in arg_types
+        )
+        return lambda value: (
+            isinstance(value, dict)
+            and all(
+                validate_key(k) and validate_value(v)
+                for k, v in elements(value.items())
+            )
+        )
+
+    if container_type is tuple and arg_types == ((),):
+        arg_types = ()
+    if container_type is tuple and Ellipsis not in arg_types:
+        validators = tuple(
+            get_validator(arg_type, validation) for arg_type in arg_types
+        )
+        return lambda value: (
+            isinstance(value, tuple)
+            and len(value) == len(validators)
+            and all(validate(x) for validate, x in zip(validators, value))
+        )
+
+    validate_element = get_validator(arg_types[0], validation)
+    if validate_element is _accept:
+        return lambda value: isinstance(value, container_type)
+    return lambda value: (
+        isinstance(value, container_type)
+        and all(map(validate_element, elements(value)))
     )
 
 
-def handle_custom_class(name: str, value: str, cls_type: type) -> Any:
-    """Handle conversion for custom classes with conversion methods."""
-    method = getattr(cls_type, CUSTOM_CLASS_METHOD_NAME)
+def compile_validator(expected_type: Any, validation: str) -> Validator:
+    """Build a validator checking an already converted value against a type hint."""
+    if expected_type is Any:
+        return _accept
+    if expected_type is None:
+        expected_type = types.NoneType
+
+    origin = get_origin(expected_type)
+    if origin in UNION_TYPES:
+        validators = tuple(
+            get_validator(arg_type, validation) for arg_type in get_args(expected_type)
+        )
+        return lambda value: any(validate(value) for validate in validators)
+    if origin in CONTAINER_TYPES:
+        # Bare typing aliases, like `typing.List`, have no arguments at all
+        if getattr(expected_type, "__args__", None) is None:
+            return lambda value: isinstance(value, origin)
+        return compile_container_validator(origin, get_args(expected_type), validation)
+    if origin is Literal:
+        literals = {(type(x), x) for x in get_args(expected_type)}
+        return lambda value: (type(value), value) in literals
+
+    checked_type = expected_type if origin is None else origin
+    if isinstance(checked_type, type):
+        return lambda value: isinstance(value, checked_type)
+
+    # TypeVars, unresolved forward references and the like can't be checked
+    return _accept
+
+
+def get_validator(expected_type: Any, validation: str | None = None) -> Validator:
+    """
+    Get the validator for a type, compiling and caching it on first use.
+
+    `validation` defaults to the `PYTTINGS_VALIDATION` policy.
+    """
+    key = (expected_type, validation or VALIDATION)
+    try:
+        return _validators[key]
+    except KeyError:
+        validator = _validators[key] = compile_validator(*key)
+        return validator
+    except TypeError:  # Unhashable type hints can't be cached
+        return compile_validator(*key)
+
+
+def get_custom_class_descriptor(
+    cls_type: type, method_name: str | None = None
+) -> tuple[Callable, Any]:
+    """
+    Get the conversion method of a custom class and the type hint of its parameter.
+
+    `method_name` defaults to `CUSTOM_CLASS_METHOD_NAME`. The method signature is
+    validated and its type hint resolved once per class.
+    """
+    method_name = method_name or CUSTOM_CLASS_METHOD_NAME
+    with suppress(KeyError):
+        return _custom_class_descriptors[cls_type, method_name]
+
+    import inspect
+
+    method = getattr(cls_type, method_name, None)
+    if not callable(method):
+        raise SettingMisconfigured(
+            f"{cls_type} can only be converted asynchronously, "
+            f"use `await settings.aload()`."
+        )
     params = list(inspect.signature(method).parameters.values())
 
     if len(params) != 1:
@@ -96,69 +386,553 @@ def handle_custom_class(name: str, value: str, cls_type: type) -> Any:
             f"Invalid method signature for {cls_type}. Expected a single parameter."
         )
 
-    param = params[0]
-    if param.annotation is inspect.Parameter.empty:
+    annotation = params[0].annotation
+    if annotation is inspect.Parameter.empty:
         raise SettingMisconfigured(
             f"Invalid method signature for {cls_type}. "
             f"Expected a type hint for the parameter."
         )
 
-    converted_param = convert_and_validate(name, value, param.annotation)
-    return method(converted_param)
+    if isinstance(annotation, str):
+        try:
+            annotation = eval(
+                annotation, getattr(method, "__globals__", {}), dict(vars(cls_type))
+            )
+        except Exception as exc:
+            raise SettingMisconfigured(
+                f"Invalid method signature for {cls_type}. "
+                f"Could not resolve the type hint '{annotation}'."
+            ) from exc
+
+    descriptor = _custom_class_descriptors[cls_type, method_name] = (method, annotation)
+    return descriptor
+
+
+def clear_custom_class_cache(cls_type: type | None = None) -> None:
+    """
+    Forget the cached conversion methods of a custom class, or of all of them.
+
+    Cached conversion results of type hints referring to the class, or to any
+    custom class, are dropped too.
+    """
+    if cls_type is None:
+        _custom_class_descriptors.clear()
+        _evict_conversions(
+            lambda hint: get_origin(hint) is None and is_custom_class(hint)
+        )
+    else:
+        _custom_class_descriptors.pop((cls_type, CUSTOM_CLASS_METHOD_NAME), None)
+        _custom_class_descriptors.pop((cls_type, CUSTOM_CLASS_ASYNC_METHOD_NAME), None)
+        _evict_conversions(lambda hint: hint is cls_type)
 
 
-def handle_simple_type(name: str, value: str, expected_type: type) -> Any:
-    """Handle conversion for simple, non-generic types."""
-    if expected_type is bool:
-        with suppress(ValueError):
-            return parse_bool(value)
-    elif expected_type is types.NoneType:
-        return value
-    elif expected_type in CONTAINER_TYPES:
-        converted_value = convert_container(value, expected_type)
-        if converted_value is not None:
-            return converted_value
-    else:
-        with suppress(ValueError, TypeError):
-            return expected_type(value)
+def _refers_to(expected_type: Any, predicate: Callable[[Any], bool]) -> bool:
+    """Check if a type hint, or any of its arguments, matches a predicate."""
+    return predicate(expected_type) or any(
+        _refers_to(arg, predicate) for arg in get_args(expected_type)
+    )
+
+
+def _evict_conversions(predicate: Callable[[Any], bool]) -> None:
+    """Drop the cached conversion results of type hints referring to matching types."""
+    with _conversion_cache_lock:
+        for cache_key in [
+            cache_key
+            for cache_key in _conversion_cache
+            if _refers_to(cache_key[0][0], predicate)
+        ]:
+            del _conversion_cache[cache_key]
+
+
+def handle_custom_class(
+    name: str, value: str, cls_type: type, validation: str | None = None
+) -> Any:
+    """Handle conversion for custom classes with conversion methods."""
+    method, annotation = get_custom_class_descriptor(cls_type)
+    return method(get_converter(annotation, validation)(name, value))
+
+
+async def ahandle_custom_class(
+    name: str, value: str, cls_type: type, validation: str | None = None
+) -> Any:
+    """Handle conversion for custom classes with asynchronous conversion methods."""
+    method, annotation = get_custom_class_descriptor(
+        cls_type, CUSTOM_CLASS_ASYNC_METHOD_NAME
+    )
+    return await method(get_converter(annotation, validation)(name, value))
+
 
-    raise SettingMisconfigured(
+def _misconfigured(name: str, value: str, expected_type: Any) -> SettingMisconfigured:
+    return SettingMisconfigured(
         f"Invalid type for {name} with configured value '{value}'."
         f"\nExpected {expected_type}."
     )
 
 
-def handle_generic_container(
-    name: str, value: str, origin: type, expected_type: type
-) -> Any:
-    """Handle conversion for generic container types."""
-    converted_value = convert_container(value, origin)
-    if converted_value is not None and validate_container_types(
-        converted_value, origin, get_args(expected_type)
-    ):
+def _observe_custom_class(
+    converter: Converter, observe: ConversionObserver
+) -> Converter:
+    def observed_converter(name: str, value: str) -> Any:
+        start = perf_counter()
+        try:
+            return converter(name, value)
+        finally:
+            observe("custom_class", perf_counter() - start)
+
+    return observed_converter
+
+
+def _observe_union_candidate(
+    converter: Converter, match: LiteralMatcher | None, observe: ConversionObserver
+) -> tuple[Converter, LiteralMatcher | None]:
+    if match is None:
+
+        def observed_converter(name: str, value: str) -> Any:
+            start = perf_counter()
+            try:
+                return converter(name, value)
+            except SettingMisconfigured:
+                observe("union_retry", perf_counter() - start)
+                raise
+
+        return observed_converter, None
+
+    def observed_match(parsed_value: Any) -> Any:
+        start = perf_counter()
+        converted_value = match(parsed_value)
+        if converted_value is None:
+            observe("union_retry", perf_counter() - start)
         return converted_value
 
-    raise SettingMisconfigured(
-        f"Invalid type for {name} with configured value '{value}'."
-        f"\nExpected {expected_type}."
+    return converter, observed_match
+
+
+def compile_literal_matcher(
+    expected_type: type, validation: str
+) -> LiteralMatcher | None:
+    """
+    Build a matcher checking an already parsed literal against a container type.
+
+    Returns None for types that can only be converted from the raw string.
+    """
+    # The origin is checked first, as parameterized types may be unhashable
+    if get_origin(expected_type) not in CONTAINER_TYPES and (
+        expected_type not in CONTAINER_TYPES
+    ):
+        return None
+
+    validate = get_validator(expected_type, validation)
+    return lambda parsed_value: parsed_value if validate(parsed_value) else None
+
+
+def compile_union_type(
+    union_type: type, validation: str, observer: ConversionObserver | None = None
+) -> Converter:
+    """
+    Build a converter trying each member of the union in order.
+
+    The value is parsed as a literal at most once and shared by every container
+    candidate, other candidates are converted from the raw string.
+    """
+    candidates = get_args(union_type)
+    plan = tuple(
+        (
+            get_converter(candidate, validation, observer),
+            compile_literal_matcher(candidate, validation),
+        )
+        for candidate in candidates
     )
+    if observer is not None:
+        plan = tuple(
+            _observe_union_candidate(*candidate, observer) for candidate in plan
+        )
+
+    def convert_union(name: str, value: str) -> Any:
+        parsed_value = _UNPARSED
+        for converter, match in plan:
+            if match is None:
+                with suppress(SettingMisconfigured):
+                    return converter(name, value)
+                continue
+
+            if parsed_value is _UNPARSED:
+                parsed_value = parse_literal(value)
+            converted_value = match(parsed_value)
+            if converted_value is not None:
+                return converted_value
+
+        raise SettingMisconfigured(
+            f"Invalid type for {name} with configured value '{value}'. "
+            f"Expected one of {candidates}."
+        )
+
+    return convert_union
+
+
+def compile_container(expected_type: type, validation: str) -> Converter:
+    """Build a converter for a container type, parameterized or not."""
+    match = compile_literal_matcher(expected_type, validation)
+    assert match is not None
+
+    def convert_container_type(name: str, value: str) -> Any:
+        converted_value = match(parse_literal(value))
+        if converted_value is None:
+            raise _misconfigured(name, value, expected_type)
+        return converted_value
+
+    origin, arg_types = get_origin(expected_type), get_args(expected_type)
+    if origin is tuple:
+        # Only variadic tuples are homogeneous
+        is_variadic = len(arg_types) == 2 and arg_types[1] is Ellipsis
+        arg_types = arg_types[:1] if is_variadic else ()
+    if (
+        origin not in STREAMABLE_CONTAINER_DELIMITERS
+        or len(arg_types) != 1
+        or arg_types[0] not in STREAMABLE_ELEMENT_TYPES
+    ):
+        return convert_container_type
+
+    element_type = arg_types[0]
+
+    def convert_streamed_container(name: str, value: str) -> Any:
+        if len(value) >= STREAMING_MIN_LENGTH and CONTAINER_PARSER == "auto":
+            converted_value = stream_collection(value, origin, element_type)
+            if converted_value is not None:
+                return converted_value
+        return convert_container_type(name, value)
+
+    return convert_streamed_container
+
+
+def compile_array(expected_type: type) -> Converter:
+    """
+    Build a converter packing a numeric sequence into an array.
+
+    `array[int]` and `array[float]` store signed 64-bit integers or doubles, and
+    a type code argument, like `array["f"]`, that type. A bare `array` infers the
+    type code from the elements. `memoryview` hints produce a read-only view over
+    the packed array.
+    """
+    origin = get_origin(expected_type) or expected_type
+    arg_types = get_args(expected_type)
+    typecode = None
+    if len(arg_types) == 1:
+        typecode = (
+            arg_types[0]
+            if isinstance(arg_types[0], str) and arg_types[0] in typecodes
+            else ARRAY_TYPECODES.get(arg_types[0])
+        )
+    if arg_types and typecode is None:
+        return compile_unsupported(expected_type)
+
+    def convert_array(name: str, value: str) -> Any:
+        parsed_value = parse_literal(value)
+        if isinstance(parsed_value, (list, tuple)):
+            code = typecode or (
+                "q" if all(type(x) is int for x in parsed_value) else "d"
+            )
+            with suppress(TypeError, OverflowError):
+                packed = array(code, parsed_value)
+                return (
+                    memoryview(packed).toreadonly() if origin is memoryview else packed
+                )
+        raise _misconfigured(name, value, expected_type)
+
+    return convert_array
+
+
+def compile_unsupported(expected_type: type) -> Converter:
+    """Build a converter rejecting every value, for unsupported type hints."""
 
+    def convert_unsupported(name: str, value: str) -> Any:
+        raise _misconfigured(name, value, expected_type)
 
-def convert_and_validate(name: str, value: str, expected_type: type) -> Any:
+    return convert_unsupported
+
+
+def compile_simple_type(expected_type: type) -> Converter:
+    """Build a converter for a simple, non-generic type."""
+    if expected_type is bool:
+
+        def convert_bool(name: str, value: str) -> Any:
+            with suppress(ValueError):
+                return parse_bool(value)
+            raise _misconfigured(name, value, expected_type)
+
+        return convert_bool
+
+    if expected_type is types.NoneType:
+        return lambda name, value: value
+
+    def convert_simple(name: str, value: str) -> Any:
+        with suppress(ValueError, TypeError):
+            return expected_type(value)
+        raise _misconfigured(name, value, expected_type)
+
+    return convert_simple
+
+
+def compile_converter(
+    expected_type: type, validation: str, observer: ConversionObserver | None = None
+) -> Converter:
+    """
+    Compile a type hint into a converter, resolving the dispatch only once.
+
+    With an `observer`, the converter reports its union retries and custom class
+    calls to it, along with the seconds they took.
+    """
     origin = get_origin(expected_type)
 
     if origin in UNION_TYPES:
-        return handle_union_type(name, value, expected_type)
+        return compile_union_type(expected_type, validation, observer)
 
     if origin is None:
         if is_custom_class(expected_type):
-            return handle_custom_class(name, value, expected_type)
-
-        return handle_simple_type(name, value, expected_type)
+            converter: Converter = lambda name, value: handle_custom_class(
+                name, value, expected_type, validation
+            )
+            if observer is not None:
+                return _observe_custom_class(converter, observer)
+            return converter
+        if expected_type in CONTAINER_TYPES:
+            return compile_container(expected_type, validation)
+        if expected_type in ARRAY_TYPES:
+            return compile_array(expected_type)
+
+        return compile_simple_type(expected_type)
     elif origin in CONTAINER_TYPES:
-        return handle_generic_container(name, value, origin, expected_type)
-
-    raise SettingMisconfigured(
-        f"Invalid type for {name} with configured value '{value}'."
-        f"\nExpected {expected_type}."
+        return compile_container(expected_type, validation)
+    elif origin in ARRAY_TYPES:
+        return compile_array(expected_type)
+
+    return compile_unsupported(expected_type)
+
+
+def _converter_key(expected_type: Any, validation: str | None) -> tuple[Any, ...]:
+    """
+    Key the converter of a type hint and validation policy.
+
+    Unions are equal whatever the order of their members, which decides the
+    candidate a value is converted to, so they're also keyed by their members.
+    """
+    if get_origin(expected_type) in UNION_TYPES:
+        return expected_type, get_args(expected_type), validation or VALIDATION
+    return expected_type, None, validation or VALIDATION
+
+
+def get_converter(
+    expected_type: type,
+    validation: str | None = None,
+    observer: ConversionObserver | None = None,
+) -> Converter:
+    """
+    Get the converter for a type, compiling and caching it on first use.
+
+    `validation` defaults to the `PYTTINGS_VALIDATION` policy. Converters reporting
+    to an `observer` are compiled separately, other converters don't carry any
+    instrumentation.
+    """
+    key = _converter_key(expected_type, validation)
+    if observer is not None:
+        return _get_observed_converter(expected_type, key, observer)
+    try:
+        return _converters[key]
+    except KeyError:
+        converter = _converters[key] = compile_converter(expected_type, key[-1])
+        return converter
+    except TypeError:  # Unhashable type hints can't be cached
+        return compile_converter(expected_type, key[-1])
+
+
+def _get_observed_converter(
+    expected_type: type, key: tuple[Any, ...], observer: ConversionObserver
+) -> Converter:
+    try:
+        return _observed_converters[key, observer]
+    except KeyError:
+        converter = compile_converter(expected_type, key[-1], observer)
+        _observed_converters[key, observer] = converter
+        return converter
+    except TypeError:  # Unhashable type hints can't be cached
+        return compile_converter(expected_type, key[-1], observer)
+
+
+def is_cacheable_type(expected_type: Any) -> bool:
+    """
+    Check if a type hint's conversions may be cached, by raw value.
+
+    That is tuples, custom classes setting `__pyttings_cacheable__` and unions
+    of these and immutable simple types. Other containers convert to mutable
+    values, and other simple types are cheaper to convert than to look up.
+    """
+    origin = get_origin(expected_type)
+    if origin in UNION_TYPES:
+        return all(
+            candidate in IMMUTABLE_TYPES or is_cacheable_type(candidate)
+            for candidate in get_args(expected_type)
+        )
+    if origin is tuple or expected_type is tuple:
+        return True
+    return (
+        origin is None
+        and is_custom_class(expected_type)
+        and getattr(expected_type, CACHEABLE_CLASS_ATTRIBUTE, False) is True
     )
+
+
+def is_immutable(value: Any) -> bool:
+    """Check if a converted value can be shared, as it can't be modified."""
+    if type(value) in IMMUTABLE_TYPES:
+        return True
+    if type(value) in (tuple, frozenset):
+        return all(map(is_immutable, value))
+    return getattr(type(value), CACHEABLE_CLASS_ATTRIBUTE, False) is True
+
+
+def compile_cached_converter(converter: Converter, key: Any) -> Converter:
+    """
+    Build a converter reusing the immutable results of previous conversions.
+
+    Results are kept in a least recently used cache of `CONVERSION_CACHE_SIZE`
+    entries, keyed by the type hint, validation policy and raw value, and shared
+    by every converter.
+    """
+
+    def convert_cached(name: str, value: str) -> Any:
+        cache_key = (key, value)
+        with _conversion_cache_lock:
+            converted_value = _conversion_cache.get(cache_key, _UNPARSED)
+            if converted_value is not _UNPARSED:
+                _conversion_cache.move_to_end(cache_key)
+                _conversion_cache_stats["hits"] += 1
+                return converted_value
+            _conversion_cache_stats["misses"] += 1
+
+        converted_value = converter(name, value)
+        if is_immutable(converted_value):
+            with _conversion_cache_lock:
+                _conversion_cache[cache_key] = converted_value
+                while len(_conversion_cache) > CONVERSION_CACHE_SIZE:
+                    _conversion_cache.popitem(last=False)
+                    _conversion_cache_stats["evictions"] += 1
+        return converted_value
+
+    return convert_cached
+
+
+def get_cached_converter(
+    expected_type: type,
+    validation: str | None = None,
+    observer: ConversionObserver | None = None,
+) -> Converter:
+    """
+    Get the converter for a type, reusing the results of previous conversions.
+
+    Falls back to `get_converter` for types whose conversions aren't cacheable
+    and when the conversion cache is disabled.
+    """
+    key = _converter_key(expected_type, validation)
+    converter_key = key if observer is None else (key, observer)
+    try:
+        return _cached_converters[converter_key]
+    except KeyError:
+        converter = get_converter(expected_type, key[-1], observer)
+        if CONVERSION_CACHE_SIZE > 0 and is_cacheable_type(expected_type):
+            converter = compile_cached_converter(converter, key)
+        _cached_converters[converter_key] = converter
+        return converter
+    except TypeError:  # Unhashable type hints can't be cached
+        return get_converter(expected_type, key[-1], observer)
+
+
+def configure_conversion_cache(size: int) -> None:
+    """Resize the conversion cache, disabling it with a size of 0."""
+    global CONVERSION_CACHE_SIZE
+    CONVERSION_CACHE_SIZE = size
+    _cached_converters.clear()
+    clear_conversion_cache()
+
+
+def conversion_cache_info() -> dict[str, int]:
+    """Get the conversion cache hits, misses, evictions, current and maximum size."""
+    with _conversion_cache_lock:
+        return _conversion_cache_stats | {
+            "size": len(_conversion_cache),
+            "maxsize": CONVERSION_CACHE_SIZE,
+        }
+
+
+def clear_conversion_cache() -> None:
+    """Drop the cached conversion results and reset their statistics."""
+    with _conversion_cache_lock:
+        _conversion_cache.clear()
+        _conversion_cache_stats.update(hits=0, misses=0, evictions=0)
+
+
+def clear_converter_cache() -> None:
+    """Drop all compiled converters, e.g. after redefining custom classes."""
+    _converters.clear()
+    _observed_converters.clear()
+    _cached_converters.clear()
+    _validators.clear()
+    _custom_class_descriptors.clear()
+    clear_conversion_cache()
+
+
+async def aconvert(
+    name: str,
+    value: str,
+    expected_type: type,
+    validation: str | None = None,
+    observer: ConversionObserver | None = None,
+) -> Any:
+    """
+    Convert a value like `get_converter`, without blocking the event loop.
+
+    Custom classes with an asynchronous conversion method are awaited, other
+    custom classes are converted in a worker thread as their conversion method
+    may block. Any other type is converted directly.
+    """
+    if get_origin(expected_type) is None and is_async_custom_class(expected_type):
+        if observer is None:
+            return await ahandle_custom_class(name, value, expected_type, validation)
+        start = perf_counter()
+        try:
+            return await ahandle_custom_class(name, value, expected_type, validation)
+        finally:
+            observer("custom_class", perf_counter() - start)
+
+    converter = get_cached_converter(expected_type, validation, observer)
+    if get_origin(expected_type) is None and is_custom_class(expected_type):
+        import asyncio
+
+        return await asyncio.to_thread(converter, name, value)
+    return converter(name, value)
+
+
+def make_immutable(value: Any) -> Any:
+    """
+    Recursively replace mutable containers with immutable equivalents.
+
+    Lists become tuples, sets frozensets and dicts read-only mapping proxies, other
+    values, including subclasses of these containers, are returned unchanged.
+    Tuples are only copied when one of their elements had to be replaced.
+    """
+    if type(value) is list:
+        return tuple(map(make_immutable, value))
+    if type(value) is tuple:
+        items = tuple(map(make_immutable, value))
+        return value if all(x is y for x, y in zip(items, value)) else items
+    if type(value) is set:
+        return frozenset(map(make_immutable, value))
+    if type(value) is dict:
+        return types.MappingProxyType(
+            {key: make_immutable(item) for key, item in value.items()}
+        )
+    return value
+
+
+def convert_and_validate(
+    name: str, value: str, expected_type: type, validation: str | None = None
+) -> Any:
+    return get_cached_converter(expected_type, validation)(name, value)
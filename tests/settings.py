@@ -1,5 +1,7 @@
 # tests/settings.py
+from array import array
 from decimal import Decimal
+from typing import Optional
 
 from tests.utils import ListOfInts, MultipleArgsCustomClass
 
@@ -20,6 +22,15 @@ SOME_STRICT_DICT: dict[str, str] = {"a": "b", "c": "d"}
 SOME_STRICT_LIST: list[str] = ["a", "b", "c"]
 SOME_CUSTOM_CLASS: ListOfInts = ListOfInts([1, 2, 3])
 SOME_MULTIPLE_CUSTOM_CLASS: MultipleArgsCustomClass = MultipleArgsCustomClass(1, "2", 3)
+SOME_ARRAY: array = array("q", [1, 2, 3])
+SOME_FLOAT_ARRAY: array = array("d", [0.5, 1.5])
+SOME_SAMPLED_LIST: list[int] = [1, 2, 3, 4]
+SOME_FORWARD_REF: "Decimal" = Decimal("1.0")
+SOME_NESTED_FORWARD_REF: Optional["Decimal"] = None
+SOME_NESTED_FORWARD_REF_LIST: list["Decimal"] = []
+SOME_UNRESOLVABLE_HINT: "UndefinedType" = 1  # type: ignore[name-defined]  # noqa: F821
+
+__pyttings_validation__ = {"SOME_SAMPLED_LIST": "sampled:2"}
 
 
 # Type hintless settings
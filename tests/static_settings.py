@@ -0,0 +1,12 @@
+# tests/static_settings.py
+from decimal import Decimal
+from typing import Optional
+
+DEBUG: bool = True
+PORT: int = 8000
+HOSTS: list[str] = ["localhost"]
+TIMEOUT: Optional[int] = None
+NO_TYPE_HINT = 1.5
+PRECISION: Decimal = Decimal("1.0")
+
+__pyttings_validation__ = {"HOSTS": "off"}
@@ -0,0 +1,109 @@
+import os
+import pickle
+from array import array
+from decimal import Decimal
+
+from pyttings.cache import (
+    dumps_settings,
+    is_private,
+    is_serializable,
+    loads_settings,
+    read_cache,
+    settings_fingerprint,
+    write_cache,
+)
+from tests.utils import ListOfInts
+
+
+# Test serializable values
+def test_is_serializable():
+    assert is_serializable(None)
+    assert is_serializable(Decimal("1.0"))
+    assert is_serializable(array("q", [1, 2]))
+    assert is_serializable({"a": [1, (2.0, frozenset({3}))], "b": {b"c"}})
+    assert not is_serializable(ListOfInts([1]))
+    assert not is_serializable([1, ListOfInts([1])])
+    assert not is_serializable({"a": ListOfInts([1])})
+    assert not is_serializable(memoryview(b""))
+
+
+# Test fingerprints
+def test_settings_fingerprint(monkeypatch):
+    fingerprint = settings_fingerprint("tests.settings", "PYTTING_")
+    assert fingerprint == settings_fingerprint("tests.settings", "PYTTING_")
+    assert fingerprint != settings_fingerprint("tests.settings", "PYTTING_", "off")
+
+    monkeypatch.setenv("OTHER_DEBUG", "False")
+    monkeypatch.setenv("PYTTING_LAZY_LOAD", "True")
+    assert fingerprint == settings_fingerprint("tests.settings", "PYTTING_")
+    monkeypatch.setenv("PYTTING_DEBUG", "False")
+    assert fingerprint != settings_fingerprint("tests.settings", "PYTTING_")
+
+
+def test_settings_fingerprint_missing_module():
+    assert settings_fingerprint("tests.missing_settings", "PYTTING_") is None
+
+
+def test_settings_fingerprint_module_change(monkeypatch, tmp_path):
+    settings_file = tmp_path / "fingerprinted_settings.py"
+    settings_file.write_text("DEBUG = True\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    fingerprint = settings_fingerprint("fingerprinted_settings", "PYTTING_")
+
+    settings_file.write_text("DEBUG = False\nPORT = 8000\n")
+    assert fingerprint != settings_fingerprint("fingerprinted_settings", "PYTTING_")
+
+
+# Test serialization
+def test_dumps_loads_settings():
+    values = {"PORT": 8000, "PRECISION": Decimal("1.0"), "CUSTOM": ListOfInts([1])}
+    data = dumps_settings("fingerprint", values)
+
+    assert loads_settings(data, "fingerprint") == (
+        {"PORT": 8000, "PRECISION": Decimal("1.0")},
+        ["CUSTOM"],
+    )
+    assert loads_settings(data, "other") is None
+    assert loads_settings(b"garbage", "fingerprint") is None
+
+
+def test_dumps_settings_volatile():
+    data = dumps_settings("fingerprint", {"PORT": 8000, "HOST": "a"}, ["HOST"])
+    assert loads_settings(data, "fingerprint") == ({"PORT": 8000}, ["HOST"])
+
+
+def test_loads_settings_refuses_arbitrary_globals():
+    data = pickle.dumps(("fingerprint", {"CUSTOM": ListOfInts([1])}, []))
+    assert loads_settings(data, "fingerprint") is None
+
+
+def test_read_write_cache(tmp_path):
+    path = str(tmp_path / "cache" / "settings.pickle")
+    assert read_cache(path, "fingerprint") is None
+
+    write_cache(path, "fingerprint", {"PORT": 8000})
+    assert read_cache(path, "fingerprint") == ({"PORT": 8000}, [])
+    assert [path.name for path in (tmp_path / "cache").iterdir()] == ["settings.pickle"]
+
+
+def test_read_write_cache_private(monkeypatch, tmp_path):
+    path = str(tmp_path / "cache" / "settings.pickle")
+    write_cache(path, "fingerprint", {"PORT": 8000})
+    assert (tmp_path / "cache").stat().st_mode & 0o777 == 0o700
+    assert is_private(os.stat(path))
+
+    # Files other users could have written are ignored
+    os.chmod(path, 0o664)
+    assert read_cache(path, "fingerprint") is None
+    os.chmod(path, 0o600)
+    os.chmod(tmp_path / "cache", 0o777)
+    assert read_cache(path, "fingerprint") is None
+    write_cache(path, "fingerprint", {"PORT": 9000})
+    os.chmod(tmp_path / "cache", 0o700)
+    assert read_cache(path, "fingerprint") == ({"PORT": 8000}, [])
+
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(path).st_uid + 1)
+    assert read_cache(path, "fingerprint") is None
+    write_cache(path, "fingerprint", {"PORT": 9000})
+    monkeypatch.undo()
+    assert read_cache(path, "fingerprint") == ({"PORT": 8000}, [])
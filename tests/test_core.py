@@ -1,11 +1,29 @@
+import asyncio
+import gc
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal, InvalidOperation
 
 import pytest
 
+import pyttings.cache
 from pyttings import settings
+from pyttings.cache import EXPORT_MAX_SIZE
 from pyttings.core import Settings
 from pyttings.exceptions import SettingMisconfigured
-from tests.utils import ListOfInts, MultipleArgsCustomClass
+from tests.utils import (
+    AsyncCustomClass,
+    ListOfInts,
+    MultipleArgsCustomClass,
+    SlowCustomClass,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -48,6 +66,19 @@ def test_custom_prefix(monkeypatch):
     assert new_settings.OTHER_SETTING == "test_value"
 
 
+# Test prefixed environment index
+def test_prefixed_environ(monkeypatch):
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    monkeypatch.setenv("PYTTING_PYTTING_NESTED", "value")
+    monkeypatch.setenv("OTHER_PORT", "9090")
+    index = Settings(lazy_load=True)._prefixed_environ()
+
+    assert index["PORT"] == "8080"
+    assert index["PYTTING_NESTED"] == "value"
+    assert "OTHER_PORT" not in index
+    assert "SETTINGS_MODULE" not in index
+
+
 # Test basic settings initialization
 def test_settings_basic_values():
     assert settings.DEBUG is True
@@ -127,6 +158,42 @@ def test_env_var_overrides_special_types(monkeypatch):
     assert settings.SOME_DECIMAL == Decimal("2.0")
 
 
+# Test environment variable overrides - arrays
+def test_env_var_overrides_array(monkeypatch):
+    monkeypatch.setenv("PYTTING_SOME_ARRAY", "[4, 5, 6]")
+
+    assert settings.SOME_ARRAY == array("q", [4, 5, 6])
+
+
+def test_env_var_overrides_array_keeps_default_typecode(monkeypatch):
+    monkeypatch.setenv("PYTTING_SOME_FLOAT_ARRAY", "[1, 2]")
+    monkeypatch.setenv("PYTTING_SOME_ARRAY", "[1.5]")
+
+    assert settings.SOME_FLOAT_ARRAY == array("d", [1.0, 2.0])
+    assert settings.SOME_FLOAT_ARRAY.typecode == "d"
+    with pytest.raises(SettingMisconfigured):
+        _ = settings.SOME_ARRAY
+
+
+# Test environment variable overrides - string type hints
+def test_env_var_overrides_string_type_hints(monkeypatch):
+    monkeypatch.setenv("PYTTING_SOME_FORWARD_REF", "2.5")
+    # Falls back to the type of the default
+    monkeypatch.setenv("PYTTING_SOME_UNRESOLVABLE_HINT", "2")
+
+    assert settings.SOME_FORWARD_REF == Decimal("2.5")
+    assert settings.SOME_UNRESOLVABLE_HINT == 2
+
+
+def test_env_var_overrides_nested_string_type_hints(monkeypatch):
+    monkeypatch.setenv("PYTTING_SOME_NESTED_FORWARD_REF", "1.5")
+    monkeypatch.setenv("PYTTING_SOME_NESTED_FORWARD_REF_LIST", "['x', 2]")
+
+    assert settings.SOME_NESTED_FORWARD_REF == Decimal("1.5")
+    with pytest.raises(SettingMisconfigured):
+        _ = settings.SOME_NESTED_FORWARD_REF_LIST
+
+
 # Test environment variable overrides - custom classes
 def test_env_var_overrides_custom_classes(monkeypatch):
     monkeypatch.setenv("PYTTING_SOME_CUSTOM_CLASS", "[1, 2, 3, 4]")
@@ -276,6 +343,25 @@ def test_env_var_type_conversion_strict_custom_class_invalid_dict(monkeypatch):
         _ = settings.SOME_MULTIPLE_CUSTOM_CLASS
 
 
+# Test validation policies
+def test_env_var_validation_policy_per_setting(monkeypatch):
+    # Only the first and third elements are sampled
+    monkeypatch.setenv("PYTTING_SOME_SAMPLED_LIST", "[1, 'x', 3, 'y']")
+    assert settings.SOME_SAMPLED_LIST == [1, "x", 3, "y"]
+
+    monkeypatch.setenv("PYTTING_SOME_SAMPLED_LIST", "['x', 2, 3, 4]")
+    with pytest.raises(SettingMisconfigured):
+        _ = Settings(lazy_load=True).SOME_SAMPLED_LIST
+
+
+def test_env_var_validation_policy_off(monkeypatch):
+    monkeypatch.setenv("PYTTING_SOME_STRICT_LIST", "[1, 2]")
+    assert Settings(validation="off").SOME_STRICT_LIST == [1, 2]
+
+    with pytest.raises(SettingMisconfigured):
+        _ = Settings(validation="full")
+
+
 # Test type conversion failures
 def test_env_var_type_conversion_failure_list(monkeypatch):
     monkeypatch.setenv("PYTTING_SOME_LIST", "1")
@@ -324,6 +410,108 @@ def test_env_var_type_conversion_failure_decimal(monkeypatch):
         _ = settings.NO_TYPE_HINT_DECIMAL
 
 
+# Test configuration variables
+def test_configuration_variables_are_not_settings(monkeypatch):
+    monkeypatch.setenv("PYTTING_LAZY_LOAD", "False")
+    assert "LAZY_LOAD" not in Settings()._cache
+    with pytest.raises(AttributeError, match="has no attribute 'LAZY_LOAD'"):
+        _ = Settings(lazy_load=True).LAZY_LOAD
+
+
+def test_pyttings_options_dont_collide_with_settings(monkeypatch, tmp_path):
+    monkeypatch.setenv("PYTTING_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("PYTTING_VALIDATION", "off")
+    assert Settings()._cache["CACHE_DIR"] == str(tmp_path)
+    assert Settings(lazy_load=True).VALIDATION == "off"
+
+    code = "import pyttings; pyttings.settings"
+    subprocess.run([sys.executable, "-c", code], check=True)
+    assert list(tmp_path.iterdir()) == []
+
+
+# Test lazy loading
+def test_settings_lazy_loading_per_key(monkeypatch):
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    lazy_settings = Settings(lazy_load=True)
+
+    assert lazy_settings.DEBUG is True
+    assert lazy_settings.PORT == 8080
+    assert "defaults" not in lazy_settings.__dict__
+
+    with pytest.raises(AttributeError, match="has no attribute 'lowercase'"):
+        _ = lazy_settings.lowercase
+
+
+# Test static defaults
+def test_settings_static_defaults(monkeypatch):
+    monkeypatch.delitem(sys.modules, "tests.static_settings", raising=False)
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "tests.static_settings")
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    monkeypatch.setenv("PYTTING_TIMEOUT", "5")
+    monkeypatch.setenv("PYTTING_HOSTS", "[1]")
+    static_settings = Settings(lazy_load=True, static_defaults=True)
+
+    assert static_settings.DEBUG is True
+    assert static_settings.PORT == 8080
+    assert static_settings.TIMEOUT == 5
+    assert static_settings.HOSTS == [1]
+    assert static_settings.NO_TYPE_HINT == 1.5
+    with pytest.raises(AttributeError, match="has no attribute 'MISSING_SETTING'"):
+        _ = static_settings.MISSING_SETTING
+    assert "tests.static_settings" not in sys.modules
+
+    # Non-literal defaults import the module
+    assert static_settings.PRECISION == Decimal("1.0")
+    assert "tests.static_settings" in sys.modules
+
+
+def test_settings_static_defaults_eager(monkeypatch, tmp_path):
+    (tmp_path / "literal_settings.py").write_text(
+        "import sys\nsys.exit('imported')\nDEBUG: bool = True\nPORT = 8000\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "literal_settings")
+    monkeypatch.setenv("PYTTING_DEBUG", "False")
+
+    eager_settings = Settings(static_defaults=True)
+    assert eager_settings._cache == {"DEBUG": False, "PORT": 8000}
+
+
+def test_settings_static_defaults_conditional_imports(monkeypatch, tmp_path):
+    (tmp_path / "conditional_settings.py").write_text(
+        "import sys\nDEBUG = True\nif sys.platform == 'win32':\n"
+        "    from ntpath import sep as PATH_SEP\nelse:\n"
+        "    from posixpath import sep as PATH_SEP\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "conditional_settings")
+
+    static_settings = Settings(static_defaults=True)
+    assert static_settings.defaults == {"DEBUG": True, "PATH_SEP": os.sep}
+    assert static_settings.PATH_SEP == os.sep
+
+
+def test_settings_static_defaults_mutated_literals(monkeypatch, tmp_path):
+    (tmp_path / "mutated_settings.py").write_text(
+        "import os\nALLOWED = ['a']\nALLOWED.append(os.environ.get('EXTRA_HOST'))\n"
+        "LIMITS = {'x': 1}\nLIMITS['x'] = 2\nGONE = 1\ndel GONE\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "mutated_settings")
+    monkeypatch.setenv("EXTRA_HOST", "b")
+
+    static_settings = Settings(lazy_load=True, static_defaults=True)
+    assert static_settings.ALLOWED == ["a", "b"]
+    assert static_settings.LIMITS == {"x": 2}
+    with pytest.raises(AttributeError):
+        _ = static_settings.GONE
+
+
+def test_settings_static_defaults_already_imported(monkeypatch):
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "tests.settings")
+    assert Settings(lazy_load=True, static_defaults=True)._static is None
+
+
 # Test eager loading
 def test_settings_eager_loading():
     eager_settings = Settings(lazy_load=False)
@@ -333,7 +521,7 @@ def test_settings_eager_loading():
 def test_settings_eager_loading_override(monkeypatch):
     monkeypatch.setenv("PYTTING_DEBUG", "False")
     eager_settings = Settings(lazy_load=False)
-    assert "DEBUG" in eager_settings._cache
+    assert eager_settings._cache["DEBUG"] is False
 
 
 def test_env_var_type_conversion_strict_list_invalid_eager(monkeypatch):
@@ -359,3 +547,569 @@ def test_env_var_type_conversion_strict_custom_class_invalid_list_eager(monkeypa
         match=r"Invalid type for SOME_CUSTOM_CLASS with configured value '.*'\.\nExpected list\[int\]\.",
     ):
         _ = Settings(lazy_load=False)
+
+
+# Test concurrent loading
+def test_settings_concurrent_loading(monkeypatch, tmp_path):
+    (tmp_path / "slow_settings.py").write_text(
+        "from tests.utils import SlowCustomClass\n"
+        + "".join(f"SLOW_{key}: SlowCustomClass = None\n" for key in range(4))
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "slow_settings")
+    for key in range(4):
+        monkeypatch.setenv(f"PYTTING_SLOW_{key}", str(key))
+    monkeypatch.setattr(SlowCustomClass, "conversions", [])
+    concurrent_settings = Settings(lazy_load=True)
+
+    barrier = threading.Barrier(32)
+
+    def load(thread: int) -> int:
+        barrier.wait()
+        return getattr(concurrent_settings, f"SLOW_{thread % 4}").value
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        values = list(executor.map(load, range(32)))
+
+    assert values == [thread % 4 for thread in range(32)]
+    assert sorted(SlowCustomClass.conversions) == [0, 1, 2, 3]
+    assert concurrent_settings._key_locks == {}
+
+
+# Test threaded loading
+def test_settings_load_workers(monkeypatch, tmp_path):
+    (tmp_path / "threaded_settings.py").write_text(
+        "from tests.utils import SlowCustomClass\n"
+        "PORT: int = 8000\n"
+        + "".join(f"SLOW_{key}: SlowCustomClass = None\n" for key in range(16))
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "threaded_settings")
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    for key in range(16):
+        monkeypatch.setenv(f"PYTTING_SLOW_{key}", str(key))
+    monkeypatch.setattr(SlowCustomClass, "conversions", [])
+    monkeypatch.setattr(SlowCustomClass, "max_running", 0)
+
+    threaded_settings = Settings(load_workers=16)
+    # Conversions overlap instead of running one after the other
+    assert SlowCustomClass.max_running > 1
+
+    assert threaded_settings._cache["PORT"] == 8080
+    assert [threaded_settings._cache[f"SLOW_{key}"].value for key in range(16)] == [
+        *range(16)
+    ]
+    assert sorted(SlowCustomClass.conversions) == [*range(16)]
+
+    # Errors are raised in the same order as when loading serially
+    monkeypatch.setenv("PYTTING_SLOW_2", "a")
+    monkeypatch.setenv("PYTTING_SLOW_5", "b")
+    with pytest.raises(SettingMisconfigured, match="SLOW_2"):
+        Settings(load_workers=16)
+
+
+# Test asynchronous loading
+def test_settings_aload(monkeypatch, tmp_path):
+    (tmp_path / "async_settings.py").write_text(
+        "from tests.utils import AsyncCustomClass, SlowCustomClass\n"
+        "PORT: int = 8000\n"
+        + "".join(f"ASYNC_{key}: AsyncCustomClass = None\n" for key in range(4))
+        + "".join(f"SLOW_{key}: SlowCustomClass = None\n" for key in range(4))
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "async_settings")
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    for key in range(4):
+        monkeypatch.setenv(f"PYTTING_ASYNC_{key}", str(key))
+        monkeypatch.setenv(f"PYTTING_SLOW_{key}", str(key))
+    monkeypatch.setattr(SlowCustomClass, "conversions", [])
+    monkeypatch.setattr(SlowCustomClass, "max_running", 0)
+    monkeypatch.setattr(AsyncCustomClass, "max_running", 0)
+    async_settings = Settings(lazy_load=True)
+
+    asyncio.run(async_settings.aload())
+    # Conversions overlap instead of running one after the other
+    assert AsyncCustomClass.max_running == 4
+    assert SlowCustomClass.max_running > 1
+
+    assert async_settings._cache["PORT"] == 8080
+    assert [async_settings._cache[f"ASYNC_{key}"].value for key in range(4)] == [
+        0,
+        1,
+        2,
+        3,
+    ]
+    assert sorted(SlowCustomClass.conversions) == [0, 1, 2, 3]
+
+
+def test_settings_aload_eager(monkeypatch, tmp_path):
+    (tmp_path / "async_only_settings.py").write_text(
+        "from tests.utils import AsyncOnlyCustomClass\n"
+        "PORT: int = 8000\nSECRET: AsyncOnlyCustomClass = None\n"
+    )
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "async_only_settings")
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    monkeypatch.setenv("PYTTING_SECRET", "[1, 2]")
+    monkeypatch.delenv("PYTTING_LAZY_LOAD", raising=False)
+
+    # Async only custom classes are left for `aload`, with the module's settings
+    code = (
+        "import asyncio\n"
+        "from pyttings import settings\n"
+        "from pyttings.exceptions import SettingMisconfigured\n"
+        "assert settings._cache == {'PORT': 8080}\n"
+        "try:\n"
+        "    settings.SECRET\n"
+        "except SettingMisconfigured as error:\n"
+        "    print(error)\n"
+        "asyncio.run(settings.aload())\n"
+        "print(settings.PORT, settings.SECRET.value)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.endswith("use `await settings.aload()`.\n8080 [1, 2]\n")
+
+
+def test_settings_aload_then_load_settings(monkeypatch, tmp_path):
+    (tmp_path / "async_loaded_settings.py").write_text(
+        "from tests.utils import AsyncOnlyCustomClass\n"
+        "PORT: int = 8000\nSECRET: AsyncOnlyCustomClass = None\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "async_loaded_settings")
+    monkeypatch.setenv("PYTTINGS_EXPORTED_SETTINGS", "")
+    monkeypatch.setenv("PYTTING_SECRET", "[1, 2]")
+    async_settings = Settings()
+    assert "SECRET" not in async_settings.load_settings()
+
+    # Settings loaded by `aload` are reused instead of converted again
+    asyncio.run(async_settings.aload())
+    secret = async_settings.SECRET
+    assert async_settings.load_settings()["SECRET"] is secret
+    assert async_settings.freeze().SECRET is secret
+    async_settings.export_for_children()
+
+
+def test_settings_aload_loaded_settings(monkeypatch):
+    monkeypatch.setenv("PYTTING_SOME_CUSTOM_CLASS", "[4, 5]")
+    eager_settings = Settings()
+    custom_class = eager_settings.SOME_CUSTOM_CLASS
+
+    # Settings already loaded aren't converted again
+    asyncio.run(eager_settings.aload())
+    assert eager_settings.SOME_CUSTOM_CLASS is custom_class
+
+
+# Test persistent cache
+def test_settings_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("PYTTING_DEBUG", "False")
+    monkeypatch.setenv("PYTTING_SOME_CUSTOM_CLASS", "[4, 5]")
+    cached_settings = Settings(cache_dir=str(tmp_path))
+    assert [path.name for path in tmp_path.iterdir()] == [
+        "tests.settings-d2904e765f036095.pickle"
+    ]
+
+    # Serializable values are read back, custom classes are converted again
+    converted = []
+    convert_env_var = Settings.convert_env_var
+
+    def tracked_convert_env_var(self, name, value):
+        converted.append(name)
+        return convert_env_var(self, name, value)
+
+    monkeypatch.setattr(Settings, "convert_env_var", tracked_convert_env_var)
+    warm_settings = Settings(cache_dir=str(tmp_path))
+    assert converted == ["SOME_CUSTOM_CLASS"]
+    assert warm_settings._cache == cached_settings._cache
+    assert warm_settings._cache["DEBUG"] is False
+    assert warm_settings._cache["SOME_CUSTOM_CLASS"] == ListOfInts([4, 5])
+
+
+def test_settings_cache_dir_stale(monkeypatch, tmp_path):
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    assert Settings(cache_dir=str(tmp_path))._cache["PORT"] == 8080
+
+    monkeypatch.setenv("PYTTING_PORT", "9090")
+    assert Settings(cache_dir=str(tmp_path))._cache["PORT"] == 9090
+
+
+def test_settings_cache_dir_computed_defaults(monkeypatch, tmp_path):
+    (tmp_path / "computed_settings.py").write_text(
+        "import os\nHOST: str = os.environ.get('APP_HOST', 'x')\nPORT: int = 8000\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "computed_settings")
+    monkeypatch.setenv("APP_HOST", "a")
+    monkeypatch.setenv("PYTTING_DEBUG", "False")
+    Settings(cache_dir=str(tmp_path / "cache"))
+
+    # Another process, where the default is computed differently
+    monkeypatch.delitem(sys.modules, "computed_settings")
+    monkeypatch.setenv("APP_HOST", "b")
+    cached_settings = Settings(cache_dir=str(tmp_path / "cache"))
+    assert cached_settings._cache == {"HOST": "b", "PORT": 8000, "DEBUG": "False"}
+
+
+def test_settings_cache_dir_mutated_literals(monkeypatch, tmp_path):
+    (tmp_path / "mutated_cached_settings.py").write_text(
+        "import os\nALLOWED = ['a']\nALLOWED.append(os.environ.get('EXTRA_HOST'))\n"
+        "PORT: int = 8000\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "mutated_cached_settings")
+    monkeypatch.setenv("EXTRA_HOST", "b")
+    Settings(cache_dir=str(tmp_path / "cache"))
+
+    # Another process, where the literal is changed differently
+    monkeypatch.delitem(sys.modules, "mutated_cached_settings")
+    monkeypatch.setenv("EXTRA_HOST", "zzz")
+    cached_settings = Settings(cache_dir=str(tmp_path / "cache"))
+    assert cached_settings._cache == {"ALLOWED": ["a", "zzz"], "PORT": 8000}
+
+
+# Test preparing for fork
+def test_settings_prepare_for_fork(monkeypatch):
+    monkeypatch.setenv("PYTTING_SOME_LIST", "[[1], {2}]")
+    monkeypatch.setenv("PYTTING_SOME_CUSTOM_CLASS", "[4, 5]")
+    fork_settings = Settings(lazy_load=True)
+    assert fork_settings.SOME_DICT == {"a": "b", "c": "d"}
+    custom_class = fork_settings.SOME_CUSTOM_CLASS
+
+    try:
+        fork_settings.prepare_for_fork()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    assert fork_settings._type_hints == {}
+    assert "defaults" not in fork_settings.__dict__
+    assert fork_settings.SOME_LIST == ((1,), frozenset({2}))
+    assert fork_settings.SOME_SET == frozenset({"a", "b", "c"})
+    with pytest.raises(TypeError):
+        fork_settings.SOME_DICT["a"] = "x"
+    # Settings already loaded aren't converted again
+    assert fork_settings.SOME_CUSTOM_CLASS is custom_class
+    assert fork_settings._raw["SOME_CUSTOM_CLASS"] == "[4, 5]"
+    assert fork_settings.PORT == 8000
+
+
+# Test exported settings
+def test_settings_export_for_children(monkeypatch):
+    monkeypatch.setenv("PYTTINGS_EXPORTED_SETTINGS", "")
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    data = Settings().export_for_children()
+    assert os.environ["PYTTINGS_EXPORTED_SETTINGS"] == data
+
+    monkeypatch.setattr(Settings, "load_settings", None)
+    child_settings = Settings(lazy_load=True)
+    assert child_settings._cache["PORT"] == 8080
+    assert "SOME_CUSTOM_CLASS" not in child_settings._cache
+    assert child_settings.SOME_CUSTOM_CLASS == ListOfInts([1, 2, 3])
+
+
+def test_settings_export_for_children_stale(monkeypatch):
+    monkeypatch.setenv("PYTTINGS_EXPORTED_SETTINGS", "")
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    Settings().export_for_children()
+
+    monkeypatch.setenv("PYTTING_PORT", "9090")
+    assert Settings()._cache["PORT"] == 9090
+
+
+def test_settings_export_for_children_large_values(monkeypatch):
+    monkeypatch.setenv("PYTTINGS_EXPORTED_SETTINGS", "")
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    large_values = {
+        name: [os.urandom(8).hex() for _ in range(6_000)]
+        for name in ("SOME_LIST", "SOME_STRICT_LIST")
+    }
+    for name, value in large_values.items():
+        monkeypatch.setenv(f"PYTTING_{name}", json.dumps(value))
+    data = Settings().export_for_children()
+    assert len(data) <= EXPORT_MAX_SIZE
+    # Processes can still be started
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+    # Large overrides are converted again from the inherited environment
+    child_settings = Settings(lazy_load=True)
+    assert child_settings._cache["PORT"] == 8080
+    assert "SOME_LIST" not in child_settings._cache
+    assert child_settings.SOME_STRICT_LIST == large_values["SOME_STRICT_LIST"]
+
+    monkeypatch.setattr(pyttings.cache, "EXPORT_MAX_SIZE", 10)
+    with pytest.raises(ValueError, match="Cannot export settings, they take"):
+        Settings().export_for_children()
+
+
+def test_settings_export_for_children_computed_defaults(monkeypatch, tmp_path):
+    (tmp_path / "exported_settings.py").write_text(
+        "import os\nHOST: str = os.environ.get('APP_HOST', 'x')\nPORT: int = 8000\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "exported_settings")
+    monkeypatch.setenv("PYTTINGS_EXPORTED_SETTINGS", "")
+    monkeypatch.setenv("APP_HOST", "a")
+    Settings().export_for_children()
+
+    # A child started with a different environment
+    monkeypatch.delitem(sys.modules, "exported_settings")
+    monkeypatch.setenv("APP_HOST", "b")
+    child_settings = Settings(lazy_load=True)
+    assert child_settings._cache == {"PORT": 8000}
+    assert child_settings.HOST == "b"
+
+
+def test_settings_export_for_children_mutated_literals(monkeypatch, tmp_path):
+    (tmp_path / "mutated_exported_settings.py").write_text(
+        "import os\nALLOWED = ['a']\nALLOWED.append(os.environ.get('EXTRA_HOST'))\n"
+        "PORT: int = 8000\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "mutated_exported_settings")
+    monkeypatch.setenv("PYTTINGS_EXPORTED_SETTINGS", "")
+    monkeypatch.setenv("EXTRA_HOST", "b")
+    Settings().export_for_children()
+
+    # A child started with a different environment
+    monkeypatch.setenv("EXTRA_HOST", "child")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    code = "import pyttings; print(pyttings.settings.ALLOWED)"
+    allowed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert allowed == "['a', 'child']\n"
+
+
+def test_settings_export_for_children_subprocess(monkeypatch, tmp_path):
+    monkeypatch.setenv("PYTTINGS_EXPORTED_SETTINGS", "")
+    Settings().export_for_children()
+    monkeypatch.setenv("PYTTING_LAZY_LOAD", "True")
+
+    code = "import sys, pyttings; pyttings.settings.PORT; print(sorted(sys.modules))"
+    modules = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert "'tests.settings'" not in modules
+
+    # Eager children with overrides don't import a module of literals either
+    (tmp_path / "literal_exported_settings.py").write_text(
+        "DEBUG: bool = True\nPORT: int = 8000\n"
+    )
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "literal_exported_settings")
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    monkeypatch.delenv("PYTTING_LAZY_LOAD")
+    Settings().export_for_children()
+
+    code = (
+        "import sys, pyttings; print(pyttings.settings.PORT); "
+        "print(sorted(sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.startswith("8080\n")
+    assert "'literal_exported_settings'" not in output
+
+
+# Test frozen snapshots
+def test_settings_freeze(monkeypatch):
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    monkeypatch.setenv("PYTTING_OTHER_SETTING", "test_value")
+    frozen = Settings(lazy_load=True).freeze()
+
+    assert frozen.PORT == 8080
+    assert frozen.DEBUG is True
+    assert frozen.OTHER_SETTING == "test_value"
+    assert frozen.SOME_CUSTOM_CLASS == ListOfInts([1, 2, 3])
+    assert not hasattr(frozen, "__dict__")
+
+    with pytest.raises(AttributeError, match="has no attribute 'MISSING_SETTING'"):
+        _ = frozen.MISSING_SETTING
+
+    with pytest.raises(AttributeError, match="read-only"):
+        frozen.PORT = 1
+
+    monkeypatch.setenv("PYTTING_PORT", "9090")
+    assert frozen.PORT == 8080
+
+
+# Test reloading
+def test_settings_reload(monkeypatch):
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    monkeypatch.setenv("PYTTING_DEBUG", "False")
+    reloaded_settings = Settings()
+    custom_class = reloaded_settings.SOME_CUSTOM_CLASS
+    cache = reloaded_settings._cache
+
+    monkeypatch.setenv("PYTTING_PORT", "9090")
+    monkeypatch.setenv("PYTTING_DEBUG", "false")
+    monkeypatch.setenv("PYTTING_OTHER_SETTING", "test_value")
+    assert reloaded_settings.reload() == ["OTHER_SETTING", "PORT"]
+    assert reloaded_settings._cache is not cache
+    assert cache["PORT"] == 8080
+    assert reloaded_settings.PORT == 9090
+    assert reloaded_settings.OTHER_SETTING == "test_value"
+    assert reloaded_settings.SOME_CUSTOM_CLASS is custom_class
+
+    monkeypatch.delenv("PYTTING_PORT")
+    monkeypatch.delenv("PYTTING_OTHER_SETTING")
+    assert reloaded_settings.reload() == ["OTHER_SETTING", "PORT"]
+    assert reloaded_settings.PORT == 8000
+    with pytest.raises(AttributeError, match="has no attribute 'OTHER_SETTING'"):
+        _ = reloaded_settings.OTHER_SETTING
+    assert reloaded_settings.reload() == []
+
+
+def test_settings_reload_lazy(monkeypatch):
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    lazy_settings = Settings(lazy_load=True)
+    assert lazy_settings.PORT == 8080
+
+    monkeypatch.setenv("PYTTING_PORT", "9090")
+    monkeypatch.setenv("PYTTING_DEBUG", "False")
+    assert lazy_settings.reload() == ["PORT"]
+    assert "DEBUG" not in lazy_settings._cache
+    assert lazy_settings.PORT == 9090
+
+
+def test_settings_reload_failure(monkeypatch):
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    reloaded_settings = Settings()
+
+    monkeypatch.setenv("PYTTING_PORT", "9090")
+    monkeypatch.setenv("PYTTING_SOME_DECIMAL", "invalid")
+    with pytest.raises(InvalidOperation):
+        reloaded_settings.reload()
+    assert reloaded_settings.PORT == 8080
+
+
+def test_settings_reload_module(monkeypatch, tmp_path):
+    settings_file = tmp_path / "reloaded_settings.py"
+    settings_file.write_text("PORT: int = 8000\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "reloaded_settings")
+    reloaded_settings = Settings()
+    assert reloaded_settings.reload(check_module=True) == []
+
+    settings_file.write_text("PORT: str = '9000'\nDEBUG = True\n")
+    os.utime(settings_file, ns=(0, 0))
+    assert reloaded_settings.reload() == []
+    assert reloaded_settings.reload(check_module=True) == ["DEBUG", "PORT"]
+    assert reloaded_settings.PORT == "9000"
+    assert reloaded_settings.DEBUG is True
+
+
+def test_settings_reload_unimported_module(monkeypatch, tmp_path):
+    settings_file = tmp_path / "unimported_settings.py"
+    settings_file.write_text("PORT: int = 8000\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTTING_SETTINGS_MODULE", "unimported_settings")
+    static_settings = Settings(static_defaults=True)
+    assert "unimported_settings" not in sys.modules
+
+    # Settings read from source are read again
+    settings_file.write_text("PORT: int = 9000\nDEBUG = True\n")
+    os.utime(settings_file, ns=(0, 0))
+    assert static_settings.reload(check_module=True) == ["DEBUG", "PORT"]
+    assert static_settings.PORT == 9000
+    assert "unimported_settings" not in sys.modules
+
+    # Exported settings import the module once it changed
+    monkeypatch.setenv("PYTTINGS_EXPORTED_SETTINGS", "")
+    static_settings.export_for_children()
+    child_settings = Settings()
+    assert "unimported_settings" not in sys.modules
+    settings_file.write_text("PORT: int = 7000\n")
+    os.utime(settings_file, ns=(1, 1))
+    assert child_settings.reload(check_module=True) == ["DEBUG", "PORT"]
+    assert child_settings.PORT == 7000
+    monkeypatch.delitem(sys.modules, "unimported_settings")
+
+
+def test_settings_install_reload_handler(monkeypatch):
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    reloaded_settings = Settings()
+    previous = signal.getsignal(signal.SIGHUP)
+    try:
+        reloaded_settings.install_reload_handler()
+        monkeypatch.setenv("PYTTING_PORT", "9090")
+        os.kill(os.getpid(), signal.SIGHUP)
+        for _ in range(100):
+            if reloaded_settings.PORT == 9090:
+                break
+            time.sleep(0.01)
+    finally:
+        signal.signal(signal.SIGHUP, previous)
+    assert reloaded_settings.PORT == 9090
+
+
+# Test subscriptions
+def test_settings_subscribe(monkeypatch):
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    subscribed_settings = Settings()
+    calls = []
+
+    def callback(name, old, new):
+        calls.append((name, old, new, subscribed_settings._cache.get(name)))
+
+    unsubscribe = subscribed_settings.subscribe("PORT", callback)
+    subscribed_settings.subscribe("SOME_*", lambda *call: calls.append(call))
+
+    monkeypatch.setenv("PYTTING_DEBUG", "False")
+    monkeypatch.setenv("PYTTING_SOME_LIST", "[1]")
+    monkeypatch.setenv("PYTTING_SOME_OTHER_SETTING", "test_value")
+    subscribed_settings.reload()
+    assert calls == [
+        ("SOME_LIST", ["a", "b", "c"], [1]),
+        ("SOME_OTHER_SETTING", None, "test_value"),
+    ]
+
+    calls.clear()
+    monkeypatch.setenv("PYTTING_PORT", "9090")
+    subscribed_settings.reload()
+    monkeypatch.setenv("PYTTING_PORT", "09090")
+    subscribed_settings.reload()
+    assert calls == [("PORT", 8080, 9090, 9090)]
+
+    calls.clear()
+    unsubscribe()
+    unsubscribe()
+    monkeypatch.delenv("PYTTING_PORT")
+    subscribed_settings.reload()
+    assert calls == []
+
+
+def test_settings_subscribe_executor(monkeypatch):
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    subscribed_settings = Settings()
+    calls = []
+    with ThreadPoolExecutor(1) as executor:
+        subscribed_settings.subscribe(
+            "PORT",
+            lambda *call: calls.append((threading.current_thread(), call)),
+            executor,
+        )
+        monkeypatch.setenv("PYTTING_PORT", "9090")
+        subscribed_settings.reload()
+    assert calls[0][0] is not threading.current_thread()
+    assert calls[0][1] == ("PORT", 8080, 9090)
+
+
+def test_settings_subscribe_failure(monkeypatch):
+    subscribed_settings = Settings()
+    calls = []
+
+    def failing_callback(name, old, new):
+        raise RuntimeError("callback failed")
+
+    subscribed_settings.subscribe("PORT", failing_callback)
+    subscribed_settings.subscribe("PORT", lambda *call: calls.append(call))
+    monkeypatch.setenv("PYTTING_PORT", "9090")
+    with pytest.raises(RuntimeError, match="callback failed"):
+        subscribed_settings.reload()
+    assert calls == [("PORT", 8000, 9090)]
+    assert subscribed_settings.PORT == 9090
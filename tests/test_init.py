@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+import pyttings
+from pyttings.core import Settings
+
+
+# Test lazy creation of the settings object
+def test_settings_created_on_first_access():
+    assert isinstance(pyttings.settings, Settings)
+    assert pyttings.settings is pyttings.settings
+
+
+def test_settings_created_once_across_threads():
+    code = (
+        "import threading, pyttings\n"
+        "barrier, ids = threading.Barrier(4), set()\n"
+        "def read():\n"
+        "    barrier.wait()\n"
+        "    ids.add(id(pyttings.settings))\n"
+        "threads = [threading.Thread(target=read) for _ in range(4)]\n"
+        "for thread in threads: thread.start()\n"
+        "for thread in threads: thread.join()\n"
+        "print(len(ids))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "1"
+
+
+def test_missing_module_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'MISSING'"):
+        _ = pyttings.MISSING  # type: ignore[attr-defined]
+
+
+# Test instrumented settings
+def test_instrumented_settings(monkeypatch):
+    monkeypatch.setenv("PYTTINGS_INSTRUMENT", "True")
+    code = "import pyttings; print(type(pyttings.settings).__name__)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "InstrumentedSettings"
+
+
+# Test that importing the package doesn't import anything else
+def test_import_is_lazy():
+    code = (
+        "import sys; before = set(sys.modules); import pyttings; "
+        "print(sorted(set(sys.modules) - before))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "['pyttings']"
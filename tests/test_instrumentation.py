@@ -0,0 +1,83 @@
+from typing import Annotated
+
+from pyttings.core import Settings
+from pyttings.instrumentation import InstrumentedSettings
+from pyttings.type_converter import get_cached_converter, get_converter
+from tests.utils import ListOfInts
+
+
+# Test recorded metrics
+def test_instrumented_settings_stats(monkeypatch):
+    monkeypatch.setenv("PYTTING_SOME_UNION_TYPE", "hello")
+    monkeypatch.setenv("PYTTING_SOME_CUSTOM_CLASS", "[4, 5]")
+    instrumented_settings = InstrumentedSettings(lazy_load=True)
+
+    assert instrumented_settings.SOME_UNION_TYPE == "hello"
+    assert instrumented_settings.SOME_CUSTOM_CLASS == ListOfInts([4, 5])
+    assert instrumented_settings.SOME_CUSTOM_CLASS == ListOfInts([4, 5])
+
+    stats = instrumented_settings.stats()
+    assert stats["import_seconds"] >= 0
+    union_stats = stats["settings"]["SOME_UNION_TYPE"]
+    assert union_stats["union_retries"] == 1
+    assert union_stats["cache_misses"] == 1
+    assert union_stats["conversion_seconds"] >= union_stats["union_retry_seconds"]
+    custom_class_stats = stats["settings"]["SOME_CUSTOM_CLASS"]
+    assert custom_class_stats["custom_class_calls"] == 1
+    assert custom_class_stats["cache_misses"] == 1
+    assert custom_class_stats["cache_hits"] == 1
+    assert custom_class_stats["type_hint_seconds"] >= 0
+
+
+def test_instrumented_settings_eager(monkeypatch):
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    stats = InstrumentedSettings().stats()
+    assert set(stats["settings"]["PORT"]) == {"type_hint_seconds", "conversion_seconds"}
+
+
+def test_instrumented_unhashable_type():
+    # Converters of unhashable type hints still report to their observer
+    events = []
+    converter = get_converter(
+        list[Annotated[int, {}]] | str,
+        observer=lambda event, seconds: events.append(event),
+    )
+    assert converter("TEST_UNHASHABLE", "a") == "a"
+    assert events == ["union_retry"]
+
+
+# Test hooks
+def test_instrumented_settings_hook(monkeypatch):
+    monkeypatch.setenv("PYTTING_PORT", "8080")
+    events = []
+    instrumented_settings = InstrumentedSettings(
+        lazy_load=True, hook=lambda *event: events.append(event)
+    )
+    assert instrumented_settings.PORT == 8080
+
+    assert [(metric, name) for metric, name, _ in events] == [
+        ("cache_misses", "PORT"),
+        ("import_seconds", None),
+        ("type_hint_seconds", "PORT"),
+        ("conversion_seconds", "PORT"),
+    ]
+
+    instrumented_settings.set_hook(None)
+    assert instrumented_settings.PORT == 8080
+    assert len(events) == 4
+
+
+# Test converters without instrumentation
+def test_uninstrumented_converters(monkeypatch):
+    monkeypatch.setenv("PYTTING_SOME_UNION_TYPE", "hello")
+    monkeypatch.setenv("PYTTING_SOME_CUSTOM_CLASS", "[4, 5]")
+    union_converter = get_cached_converter(dict | str)
+    instrumented_settings = InstrumentedSettings(lazy_load=True)
+    assert instrumented_settings.SOME_UNION_TYPE == "hello"
+    assert instrumented_settings.SOME_CUSTOM_CLASS == ListOfInts([4, 5])
+    stats = instrumented_settings.stats()
+
+    assert get_cached_converter(dict | str) is union_converter
+    assert get_converter(ListOfInts).__name__ == "<lambda>"
+    assert Settings(lazy_load=True).SOME_UNION_TYPE == "hello"
+    assert instrumented_settings.stats() == stats
@@ -0,0 +1,140 @@
+from typing import Optional
+
+import pytest
+
+from pyttings.static import parse_settings_source, read_static_settings
+
+SOURCE = """
+import os
+from typing import Optional as Opt
+from decimal import Decimal
+
+DEBUG: bool = True
+A = B = [1, 2]
+PORT: int = int(os.getenv("PORT", "8000"))
+TIMEOUT: Opt[int] = None
+PRECISION: Decimal = Decimal("1.0")
+ANNOTATED_ONLY: int
+X, Y = 1, 2
+COUNT = 1
+COUNT += 1
+
+if os.getenv("DEBUG"):
+    CONDITIONAL = True
+"""
+
+
+def test_parse_settings_source():
+    static = parse_settings_source(SOURCE)
+
+    assert static.complete is True
+    assert static.get_value("DEBUG", None) is True
+    assert static.get_value("A", None) == [1, 2]
+    assert static.get_value("B", None) == [1, 2]
+    for name in ("PORT", "PRECISION", "X", "Y", "COUNT", "CONDITIONAL", "os"):
+        assert name in static.dynamic_names
+        assert static.get_value(name, None) is None
+        assert static.is_undefined(name) is False
+
+    assert static.is_undefined("ANNOTATED_ONLY") is True
+    assert static.is_undefined("MISSING") is True
+
+
+def test_parse_settings_source_annotations():
+    static = parse_settings_source(SOURCE)
+
+    assert static.eval_annotation("DEBUG") is bool
+    assert static.eval_annotation("TIMEOUT") == Optional[int]
+    assert static.eval_annotation("ANNOTATED_ONLY") is int
+    # Names defined by the settings module itself require importing it
+    with pytest.raises(NameError, match="'Decimal' is defined by the settings module"):
+        static.eval_annotation("PRECISION")
+
+
+def test_parse_settings_source_incomplete():
+    assert parse_settings_source("from os import *").complete is False
+    assert parse_settings_source("def __getattr__(name): ...").complete is False
+    assert parse_settings_source("globals()['PORT'] = 1").complete is False
+    assert parse_settings_source("globals().update(PORT=1)").complete is False
+    assert parse_settings_source("if True:\n    from os import *").complete is False
+
+
+def test_parse_settings_source_nested_bindings():
+    static = parse_settings_source(
+        """
+import sys
+
+if sys.platform == "win32":
+    from ntpath import sep as PATH_SEP
+else:
+    from posixpath import sep as PATH_SEP
+
+try:
+    import tomllib as TOML
+except ImportError:
+    TOML = None
+
+with open(__file__) as source:
+    class Handler: ...
+    def handle(): ...
+
+def configure():
+    global CONFIGURED
+    CONFIGURED = True
+
+(WALRUS := 1)
+LIMIT = (MAX := 10) + 1
+"""
+    )
+
+    assert static.complete is True
+    for name in (
+        "PATH_SEP",
+        "TOML",
+        "Handler",
+        "handle",
+        "CONFIGURED",
+        "WALRUS",
+        "LIMIT",
+        "MAX",
+    ):
+        assert name in static.dynamic_names
+        assert static.is_undefined(name) is False
+
+
+def test_parse_settings_source_mutated_literals():
+    static = parse_settings_source(
+        """
+import os
+
+ALLOWED: list[str] = ["a"]
+ALLOWED.append(os.environ.get("EXTRA_HOST"))
+LIMITS: dict[str, int] = {"x": 1}
+LIMITS["x"] = 2
+COUNTS = {"x": 1}
+COUNTS["x"] += 1
+GONE = 1
+del GONE
+ALIASED = [1]
+ALIAS = ALIASED
+UNCHANGED: dict[str, int] = {"x": 1}
+
+def extend():
+    ALIASED.extend([2])
+"""
+    )
+
+    for name in ("ALLOWED", "LIMITS", "COUNTS", "GONE", "ALIASED"):
+        assert name in static.dynamic_names
+        assert name not in static.values
+        assert static.get_value(name, None) is None
+        assert static.is_undefined(name) is False
+    assert static.get_value("UNCHANGED", None) == {"x": 1}
+
+
+def test_read_static_settings():
+    static = read_static_settings("tests.static_settings")
+    assert static is not None
+    assert static.get_value("HOSTS", None) == ["localhost"]
+
+    assert read_static_settings("not.found.settings.module") is None
@@ -1,20 +1,46 @@
+import asyncio
+import json
+import operator
 import os
+import sys
 import types
+from array import array
 from decimal import Decimal
 from importlib import reload
-from typing import Dict, List, Set, Tuple, Union
+from typing import Annotated, Dict, List, Optional, Set, Tuple, Union
 
 import pytest
 
+import pyttings.type_converter
 from pyttings.exceptions import SettingMisconfigured
 from pyttings.type_converter import (
+    aconvert,
+    clear_conversion_cache,
+    clear_converter_cache,
+    clear_custom_class_cache,
+    configure_conversion_cache,
+    conversion_cache_info,
     convert_and_validate,
     convert_container,
+    get_cached_converter,
+    get_converter,
+    get_validator,
     is_custom_class,
+    make_immutable,
     parse_bool,
+    parse_validation_policy,
+    stream_collection,
     validate_container_types,
 )
-from tests.utils import InvalidCustomClass, SimpleCustomClass, UntypedCustomClass
+from tests.utils import (
+    AsyncCustomClass,
+    AsyncOnlyCustomClass,
+    CacheableCustomClass,
+    ForwardRefCustomClass,
+    InvalidCustomClass,
+    SimpleCustomClass,
+    UntypedCustomClass,
+)
 
 
 # Test is_custom_class function
@@ -126,13 +152,13 @@ def test_validate_container_types_list():
 
 def test_validate_container_types_tuple():
     # Valid homogeneous tuple
-    assert validate_container_types((1, 2, 3), tuple, (int,)) is True
+    assert validate_container_types((1, 2, 3), tuple, (int, Ellipsis)) is True
     # Valid mixed tuple (when type checking is not enforced)
     assert validate_container_types((1, "a", 3.0), tuple, None) is True
     # Invalid type
-    assert validate_container_types((1, "a", 3), tuple, (int,)) is False
+    assert validate_container_types((1, "a", 3), tuple, (int, Ellipsis)) is False
     # Not a tuple
-    assert validate_container_types([1, 2, 3], tuple, (int,)) is False
+    assert validate_container_types([1, 2, 3], tuple, (int, Ellipsis)) is False
 
 
 def test_validate_container_types_set():
@@ -312,3 +338,447 @@ def test_convert_and_validate_custom_class():
         SettingMisconfigured, match="Invalid method signature for.*Expected a type hint"
     ):
         convert_and_validate("TEST_CUSTOM", "[1, 2, 3]", UntypedCustomClass)
+
+
+# Test converter plan compilation and caching
+def test_get_converter_is_cached():
+    list_int_type = List[int]
+    converter = get_converter(list_int_type)
+    assert get_converter(list_int_type) is converter
+    assert converter("TEST_LIST", "[1, 2, 3]") == [1, 2, 3]
+
+    clear_converter_cache()
+    assert get_converter(list_int_type) is not converter
+
+
+def test_get_converter_unhashable_type():
+    # Unhashable type hints are compiled without being cached
+    unhashable_type = Annotated[int, {}]
+    assert get_converter(unhashable_type) is not get_converter(unhashable_type)
+    with pytest.raises(SettingMisconfigured):
+        convert_and_validate("TEST_UNHASHABLE", "1", unhashable_type)
+    unhashable_union = list[Annotated[int, {}]] | str
+    assert convert_and_validate("TEST_UNHASHABLE", "a", unhashable_union) == "a"
+
+
+def test_get_converter_nested_union():
+    converter = get_converter(Union[int, List[str], None])
+    assert converter("TEST_UNION", "42") == 42
+    assert converter("TEST_UNION", '["a"]') == ["a"]
+    assert converter("TEST_UNION", "abc") == "abc"
+
+
+def test_get_converter_reordered_unions():
+    assert get_converter(int | str)("TEST_UNION", "1") == 1
+    assert get_converter(str | int)("TEST_UNION", "1") == "1"
+    assert get_converter(Union[int, str])("TEST_UNION", "1") == 1
+    assert get_converter(Union[str, int])("TEST_UNION", "1") == "1"
+
+
+def test_convert_and_validate_union_parses_once(monkeypatch):
+    calls = []
+    original_parse_literal = pyttings.type_converter.parse_literal
+
+    def counting_parse_literal(value):
+        calls.append(value)
+        return original_parse_literal(value)
+
+    monkeypatch.setattr(
+        pyttings.type_converter, "parse_literal", counting_parse_literal
+    )
+    union_type = Union[Dict[str, int], List[int], Set[int], str]
+
+    assert get_converter(union_type)("TEST_UNION", "{1, 2}") == {1, 2}
+    assert get_converter(union_type)("TEST_UNION", "hello") == "hello"
+    assert calls == ["{1, 2}", "hello"]
+
+
+def test_convert_and_validate_custom_class_forward_ref():
+    assert convert_and_validate(
+        "TEST_CUSTOM", "[1, 2, 3]", ForwardRefCustomClass
+    ) == ForwardRefCustomClass([1, 2, 3])
+
+    with pytest.raises(
+        SettingMisconfigured, match="Invalid type for TEST_CUSTOM with configured value"
+    ):
+        convert_and_validate("TEST_CUSTOM", '["a"]', ForwardRefCustomClass)
+
+
+def test_custom_class_cache_invalidation():
+    class RedefinedCustomClass:
+        @classmethod
+        def __pyttings_convert__(cls, value: int):
+            return value
+
+    assert convert_and_validate("TEST_CUSTOM", "1", RedefinedCustomClass) == 1
+
+    @classmethod  # type: ignore[misc]
+    def str_convert(cls, value: str):
+        return value
+
+    RedefinedCustomClass.__pyttings_convert__ = str_convert  # type: ignore[method-assign, assignment]
+    assert convert_and_validate("TEST_CUSTOM", "1", RedefinedCustomClass) == 1
+
+    clear_custom_class_cache(RedefinedCustomClass)
+    assert convert_and_validate("TEST_CUSTOM", "1", RedefinedCustomClass) == "1"
+
+
+def test_custom_class_cache_invalidation_cached_results():
+    class RedefinedCacheableClass(CacheableCustomClass): ...
+
+    def convert_all():
+        return [
+            convert_and_validate("TEST_CUSTOM", "1", hint)
+            for hint in (RedefinedCacheableClass, RedefinedCacheableClass | None)
+        ]
+
+    # Cached instances are dropped along with the class's conversion method
+    cached = convert_all()
+    assert all(map(operator.is_, convert_all(), cached))
+    clear_custom_class_cache(RedefinedCacheableClass)
+    assert not any(map(operator.is_, convert_all(), cached))
+
+    cached = convert_all()
+    clear_custom_class_cache()
+    assert not any(map(operator.is_, convert_all(), cached))
+
+
+# Test asynchronous conversion
+def test_aconvert():
+    assert asyncio.run(aconvert("TEST_INT", "1", int)) == 1
+    assert asyncio.run(aconvert("TEST_CUSTOM", "1", AsyncCustomClass)).value == 1
+    assert asyncio.run(aconvert("TEST_CUSTOM", "[1]", SimpleCustomClass)).value == [1]
+    assert asyncio.run(aconvert("TEST_CUSTOM", "[1]", AsyncOnlyCustomClass)).value == [
+        1
+    ]
+
+    # Synchronous conversion uses the synchronous method only
+    assert convert_and_validate("TEST_CUSTOM", "1", AsyncCustomClass).value == -1
+    with pytest.raises(
+        SettingMisconfigured, match="can only be converted asynchronously"
+    ):
+        convert_and_validate("TEST_CUSTOM", "[1]", AsyncOnlyCustomClass)
+
+
+# Test container parser strategies
+def test_convert_container_auto_parser(monkeypatch):
+    monkeypatch.setattr(pyttings.type_converter, "CONTAINER_PARSER", "auto")
+    assert convert_container('{"a": [1, 2.5], "b": "c"}', dict) == {
+        "a": [1, 2.5],
+        "b": "c",
+    }
+    # Python-only syntax falls back to ast.literal_eval
+    assert convert_container("{'a': (1, 2)}", dict) == {"a": (1, 2)}
+    assert convert_container("{1, 2}", set) == {1, 2}
+    # JSON-only syntax is rejected like with ast.literal_eval
+    assert convert_container('{"a": true, "b": null}', dict) is None
+    assert convert_container("[NaN, Infinity]", list) is None
+    assert convert_container('["true", "null"]', list) == ["true", "null"]
+    # String escapes read like Python ones
+    assert convert_container('["caf\\u00e9", "a\\tb"]', list) == ["café", "a\tb"]
+
+
+def test_convert_container_json_parser(monkeypatch):
+    monkeypatch.setattr(pyttings.type_converter, "CONTAINER_PARSER", "json")
+    assert convert_container('["a", "b"]', list) == ["a", "b"]
+    assert convert_container("['a', 'b']", list) is None
+    assert convert_container('{"a": true, "b": null}', dict) == {"a": True, "b": None}
+    assert convert_container("(1, 2)", tuple) is None
+
+
+def test_convert_container_literal_parser(monkeypatch):
+    monkeypatch.setattr(pyttings.type_converter, "CONTAINER_PARSER", "literal")
+    assert convert_container("['a', 'b']", list) == ["a", "b"]
+    assert convert_container('{"a": true}', dict) is None
+
+
+def test_invalid_container_parser():
+    try:
+        os.environ["PYTTINGS_CONTAINER_PARSER"] = "yaml"
+        with pytest.raises(ValueError, match="Invalid 'PYTTINGS_CONTAINER_PARSER'"):
+            reload(pyttings.type_converter)
+    finally:
+        del os.environ["PYTTINGS_CONTAINER_PARSER"]
+        reload(pyttings.type_converter)
+
+
+# Test streaming of large flat collections
+def test_stream_collection():
+    assert stream_collection(' {"a", "b" ,"c"} ', set, str) == {"a", "b", "c"}
+    assert stream_collection("(1, 2, 3,)", tuple, int) == (1, 2, 3)
+    assert stream_collection("()", tuple, str) == ()
+    assert stream_collection("(1.5,)", tuple, float) == (1.5,)
+    # Invalid syntax or elements
+    assert stream_collection("(1, 2", tuple, int) is None
+    assert stream_collection("(1 2)", tuple, int) is None
+    assert stream_collection("(1, 2) 3", tuple, int) is None
+    assert stream_collection("(1, [2])", tuple, int) is None
+    assert stream_collection("(1, '2')", tuple, int) is None
+    assert stream_collection("(1)", tuple, int) is None
+    assert stream_collection("{}", set, int) is None
+    # Values JSON reads differently are left to the regular parser
+    assert stream_collection("(1.5, NaN)", tuple, float) is None
+    assert stream_collection("(1.5, -Infinity)", tuple, float) is None
+    assert stream_collection('("\\u00e9",)', tuple, str) is None
+
+
+def test_convert_and_validate_streamed_collections(monkeypatch):
+    monkeypatch.setattr(pyttings.type_converter, "STREAMING_MIN_LENGTH", 0)
+    clear_converter_cache()
+
+    values = {f"10.0.{i // 256}.{i % 256}" for i in range(50_000)}
+    value = "{" + json.dumps(sorted(values))[1:-1] + "}"
+    assert convert_and_validate("TEST_SET", value, Set[str]) == values
+    assert convert_and_validate("TEST_TUPLE", "(1, 2)", Tuple[int, ...]) == (1, 2)
+    with pytest.raises(SettingMisconfigured):
+        convert_and_validate("TEST_TUPLE", "(1, 2)", Tuple[int])
+    # Python-only syntax falls back to the regular parser
+    assert convert_and_validate("TEST_SET", "{'a', 'b'}", Set[str]) == {"a", "b"}
+    assert convert_and_validate("TEST_TUPLE", '("\\u00e9",)', Tuple[str, ...]) == ("é",)
+    with pytest.raises(SettingMisconfigured):
+        convert_and_validate("TEST_TUPLE", "(1.5, NaN)", Tuple[float, ...])
+
+    with pytest.raises(
+        SettingMisconfigured, match="Invalid type for TEST_SET with configured value"
+    ):
+        convert_and_validate("TEST_SET", '{"a", 1}', Set[str])
+
+    clear_converter_cache()
+
+
+# Test array conversion
+def test_convert_and_validate_array():
+    assert convert_and_validate("TEST_ARRAY", "[1, 2, 3]", array) == array(
+        "q", [1, 2, 3]
+    )
+    assert convert_and_validate("TEST_ARRAY", "(1, 2.5)", array) == array("d", [1, 2.5])
+
+    view = convert_and_validate("TEST_VIEW", "[1, 2, 3]", memoryview)
+    assert view.readonly is True
+    assert view.tolist() == [1, 2, 3]
+
+    with pytest.raises(
+        SettingMisconfigured, match="Invalid type for TEST_ARRAY with configured value"
+    ):
+        convert_and_validate("TEST_ARRAY", '["a"]', array)
+
+    with pytest.raises(
+        SettingMisconfigured, match="Invalid type for TEST_ARRAY with configured value"
+    ):
+        convert_and_validate("TEST_ARRAY", "[1, 2, 3", array)
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="array is subscriptable in 3.12+"
+)
+def test_convert_and_validate_typed_array():
+    int_array_type = array[int]  # type: ignore[misc]
+    float_array_type = array[float]  # type: ignore[misc]
+    assert convert_and_validate("TEST_ARRAY", "[1, 2]", int_array_type) == array(
+        "q", [1, 2]
+    )
+    assert convert_and_validate("TEST_ARRAY", "[1, 2]", float_array_type) == array(
+        "d", [1, 2]
+    )
+
+    with pytest.raises(
+        SettingMisconfigured, match="Invalid type for TEST_ARRAY with configured value"
+    ):
+        convert_and_validate("TEST_ARRAY", "[1.5]", int_array_type)
+
+
+def test_convert_and_validate_typecode_array():
+    float32_array_type = types.GenericAlias(array, ("f",))
+    assert convert_and_validate("TEST_ARRAY", "[1, 2]", float32_array_type) == array(
+        "f", [1, 2]
+    )
+    view = convert_and_validate(
+        "TEST_VIEW", "[1, 2]", types.GenericAlias(memoryview, ("d",))
+    )
+    assert view.format == "d"
+
+
+# Test nested generic validation
+def test_validate_container_types_nested():
+    assert validate_container_types([[1], [2, 3]], list, (List[int],)) is True
+    assert validate_container_types([[1], ["2"]], list, (List[int],)) is False
+    assert validate_container_types({"a": [1]}, dict, (str, List[int])) is True
+    assert validate_container_types({"a": [1, "b"]}, dict, (str, List[int])) is False
+    assert validate_container_types([1, "a", None], list, (Union[int, str, None],))
+    assert validate_container_types([1.0], list, (Union[int, str],)) is False
+
+
+def test_validate_container_types_tuples():
+    # Fixed length tuples
+    assert validate_container_types((1, "a"), tuple, (int, str)) is True
+    assert validate_container_types(("a", 1), tuple, (int, str)) is False
+    assert validate_container_types((1, "a", "b"), tuple, (int, str)) is False
+    # A single type argument is a 1-tuple
+    assert validate_container_types((1,), tuple, (int,)) is True
+    assert validate_container_types((1, 2), tuple, (int,)) is False
+    # Variadic tuples
+    assert validate_container_types((1, 2, 3), tuple, (int, Ellipsis)) is True
+    assert validate_container_types((1, "a"), tuple, (int, Ellipsis)) is False
+    assert validate_container_types((), tuple, (int, Ellipsis)) is True
+
+
+def test_convert_and_validate_bare_typing_aliases():
+    assert convert_and_validate("TEST_LIST", "[1, 'a']", List) == [1, "a"]
+    assert convert_and_validate("TEST_DICT", "{}", Dict) == {}
+    assert convert_and_validate("TEST_TUPLE", "(1,)", Tuple) == (1,)
+    assert convert_and_validate("TEST_NESTED", "[[1], ['a']]", List[List]) == [
+        [1],
+        ["a"],
+    ]
+    with pytest.raises(SettingMisconfigured):
+        convert_and_validate("TEST_LIST", "(1,)", List)
+
+
+def test_convert_and_validate_nested_generics():
+    routes_type = Dict[str, List[Tuple[str, int]]]
+    assert convert_and_validate(
+        "TEST_ROUTES", '{"api": [("a", 1), ("b", 2)]}', routes_type
+    ) == {"api": [("a", 1), ("b", 2)]}
+
+    with pytest.raises(
+        SettingMisconfigured, match="Invalid type for TEST_ROUTES with configured value"
+    ):
+        convert_and_validate("TEST_ROUTES", '{"api": [("a", "1")]}', routes_type)
+
+    assert get_validator(List[int]) is get_validator(List[int])
+
+
+# Test validation policies
+def test_parse_validation_policy():
+    assert parse_validation_policy("full") is None
+    assert parse_validation_policy("OFF") == 0
+    assert parse_validation_policy("sampled:10") == 10
+    for policy in ("sampled", "sampled:0", "sampled:x", "partial", "off:1"):
+        with pytest.raises(ValueError, match="Invalid validation policy"):
+            parse_validation_policy(policy)
+
+
+def test_validate_container_types_policies():
+    values = list(range(100)) + ["a"]
+    assert validate_container_types(values, list, (int,), "full") is False
+    assert validate_container_types(values, list, (int,), "off") is True
+    assert validate_container_types(values, list, (int,), "sampled:10") is True
+    assert validate_container_types(values, list, (int,), "sampled:200") is False
+    assert validate_container_types({"a": "b"}, dict, (str, int), "sampled:1") is False
+    # The container type itself is always checked
+    assert validate_container_types((1, 2), list, (int,), "off") is False
+
+
+def test_convert_and_validate_policy():
+    assert convert_and_validate(
+        "TEST_LIST", "[[1], ['a']]", List[List[int]], "off"
+    ) == [
+        [1],
+        ["a"],
+    ]
+    with pytest.raises(
+        SettingMisconfigured, match="Invalid type for TEST_LIST with configured value"
+    ):
+        convert_and_validate("TEST_LIST", "[[1], ['a']]", List[List[int]], "full")
+
+
+# Test immutable values
+def test_make_immutable():
+    value = make_immutable({"a": [1, {2}], "b": ({"c": [3]},)})
+    assert isinstance(value, types.MappingProxyType)
+    assert value == {"a": (1, frozenset({2})), "b": ({"c": (3,)},)}
+    assert isinstance(value["b"][0], types.MappingProxyType)
+
+    immutable_value = (1, ("a",), frozenset({2}))
+    assert make_immutable(immutable_value) is immutable_value
+    custom_value = SimpleCustomClass(1)
+    assert make_immutable(custom_value) is custom_value
+
+
+# Test conversion cache
+def test_conversion_cache():
+    clear_conversion_cache()
+    first = convert_and_validate("TEST_TUPLE", "(1, 'a')", Tuple[int, str])
+    second = convert_and_validate("OTHER_TUPLE", "(1, 'a')", Tuple[int, str])
+    assert first == (1, "a")
+    assert second is first
+    assert conversion_cache_info() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "size": 1,
+        "maxsize": 256,
+    }
+
+    # The validation policy is part of the key
+    convert_and_validate("TEST_TUPLE", "(1, 'a')", Tuple[int, str], "off")
+    assert conversion_cache_info()["size"] == 2
+
+
+def test_conversion_cache_reordered_unions():
+    clear_conversion_cache()
+    assert convert_and_validate("TEST_UNION", "1", int | bool) == 1
+    assert convert_and_validate("TEST_UNION", "1", bool | int) is True
+    assert conversion_cache_info()["size"] == 2
+
+
+def test_conversion_cache_mutable_values():
+    clear_conversion_cache()
+    # Lists are never cached, tuples of mutable values aren't either
+    assert get_cached_converter(List[int]) is get_converter(List[int])
+    first = convert_and_validate("TEST_TUPLE", "([1], [2])", Tuple[List[int], ...])
+    second = convert_and_validate("TEST_TUPLE", "([1], [2])", Tuple[List[int], ...])
+    assert first == second
+    assert first is not second
+    assert conversion_cache_info()["size"] == 0
+
+
+def test_conversion_cache_mutable_unions():
+    # Unions are only cached when none of their members convert to mutable values
+    assert get_cached_converter(int | List[int]) is get_converter(int | List[int])
+    assert get_cached_converter(str | SimpleCustomClass) is get_converter(
+        str | SimpleCustomClass
+    )
+    assert get_cached_converter(Optional[Tuple[int, ...]]) is not get_converter(
+        Optional[Tuple[int, ...]]
+    )
+    assert get_cached_converter(str | CacheableCustomClass) is not get_converter(
+        str | CacheableCustomClass
+    )
+
+
+def test_conversion_cache_custom_classes():
+    clear_conversion_cache()
+    assert get_cached_converter(SimpleCustomClass) is get_converter(SimpleCustomClass)
+
+    first = convert_and_validate("TEST_CUSTOM", "1", CacheableCustomClass)
+    assert convert_and_validate("TEST_CUSTOM", "1", CacheableCustomClass) is first
+    assert conversion_cache_info()["hits"] == 1
+
+
+def test_conversion_cache_eviction(monkeypatch):
+    clear_conversion_cache()
+    monkeypatch.setattr(pyttings.type_converter, "CONVERSION_CACHE_SIZE", 2)
+    for value in ("1", "2", "1", "3"):
+        convert_and_validate("TEST_UNION", value, Union[int, str])
+
+    # "2" was the least recently used value
+    assert conversion_cache_info() == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+        "size": 2,
+        "maxsize": 2,
+    }
+    convert_and_validate("TEST_UNION", "1", Union[int, str])
+    assert conversion_cache_info()["hits"] == 2
+
+
+def test_conversion_cache_disabled():
+    try:
+        configure_conversion_cache(0)
+        assert get_cached_converter(Tuple[int, str]) is get_converter(Tuple[int, str])
+        convert_and_validate("TEST_TUPLE", "(1, 'a')", Tuple[int, str])
+        assert conversion_cache_info()["size"] == 0
+    finally:
+        configure_conversion_cache(256)
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 from typing import List
 
 
@@ -61,3 +64,78 @@ class UntypedCustomClass:
     def __pyttings_convert__(cls, value): ...
 
     def __init__(self, value): ...
+
+
+class ForwardRefCustomClass:
+    def __init__(self, value):
+        self.value = value
+
+    @classmethod
+    def __pyttings_convert__(cls, value: "List[int]") -> "ForwardRefCustomClass":
+        return cls(value)
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class SlowCustomClass:
+    conversions: List[int] = []
+    # Number of conversions running at once, and its maximum
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def __init__(self, value):
+        self.value = value
+
+    @classmethod
+    def __pyttings_convert__(cls, value: int) -> "SlowCustomClass":
+        with cls.lock:
+            cls.conversions.append(value)
+            cls.running += 1
+            cls.max_running = max(cls.max_running, cls.running)
+        time.sleep(0.01)
+        with cls.lock:
+            cls.running -= 1
+        return cls(value)
+
+
+class AsyncCustomClass:
+    # Number of conversions running at once, and its maximum
+    running = 0
+    max_running = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    @classmethod
+    def __pyttings_convert__(cls, value: int) -> "AsyncCustomClass":
+        return cls(-value)
+
+    @classmethod
+    async def __pyttings_aconvert__(cls, value: int) -> "AsyncCustomClass":
+        cls.running += 1
+        cls.max_running = max(cls.max_running, cls.running)
+        await asyncio.sleep(0.01)
+        cls.running -= 1
+        return cls(value)
+
+
+class AsyncOnlyCustomClass:
+    def __init__(self, value):
+        self.value = value
+
+    @classmethod
+    async def __pyttings_aconvert__(cls, value: List[int]) -> "AsyncOnlyCustomClass":
+        return cls(value)
+
+
+class CacheableCustomClass:
+    __pyttings_cacheable__ = True
+
+    def __init__(self, value):
+        self.value = value
+
+    @classmethod
+    def __pyttings_convert__(cls, value: int) -> "CacheableCustomClass":
+        return cls(value)